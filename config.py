@@ -1,51 +1,63 @@
 # config.py
 from agents import AsyncOpenAI, ModelSettings
-from typing import Literal
+from functools import cache
+from typing import Final, Literal, get_args
 import os
-from dotenv import load_dotenv
+import sys
+from pathlib import Path
 
-# Load environment variables from .env file
-load_dotenv()
 
-# Global model configuration constants
-BIG_MODEL = "qwen3-30b-a3b@q8_0"
-SMALL_MODEL = "qwen3-1.7b"
+def _find_dotenv() -> Path | None:
+    """Return the nearest .env in this file's directory or its parents.
+
+    Mirrors where load_dotenv() looks by default, without importing dotenv.
+    """
+    for directory in Path(__file__).resolve().parents:
+        candidate = directory / ".env"
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+# Load environment variables from .env file. Variables already exported take
+# precedence; dotenv is only imported when there is a file to parse, which is
+# usually not the case in deployments configured through real env vars.
+_DOTENV_PATH = _find_dotenv()
+if _DOTENV_PATH is not None:
+    from dotenv import load_dotenv
+
+    load_dotenv(_DOTENV_PATH)
+
+# Resolve client configuration once at import time
+_API_KEY = os.getenv("OPENAI_API_KEY") or os.getenv(
+    "TEST_DUMMY_API_KEY", "dummy_for_local_if_no_env_set"
+)
+_BASE_URL = os.getenv("OPENAI_BASE_URL", "http://localhost:1234/v1")
 
 # Type alias for model names - only these two values are allowed
 Model = Literal["qwen3-30b-a3b@q8_0", "qwen3-1.7b"]
 
-# Default model settings for all agents
-default_model_settings = ModelSettings(
-    temperature=0.6,
-    top_p=0.95
-)
+# Global model configuration constants, read back from the Literal so each
+# model name is spelled out only once
+_BIG_MODEL_NAME, _SMALL_MODEL_NAME = get_args(Model)
+BIG_MODEL: Final[str] = sys.intern(_BIG_MODEL_NAME)
+SMALL_MODEL: Final[str] = sys.intern(_SMALL_MODEL_NAME)
 
-# Model-specific settings
-big_model_settings = ModelSettings(
+# Default model settings for all agents. The big/small variants currently share
+# identical values, so they alias one instance; treat it as read-only and use
+# ModelSettings.resolve() to derive per-agent overrides.
+_SHARED_MODEL_SETTINGS = ModelSettings(
     temperature=0.6,
     top_p=0.95
 )
 
-small_model_settings = ModelSettings(
-    temperature=0.6,
-    top_p=0.95
-)
+default_model_settings = _SHARED_MODEL_SETTINGS
 
-_external_client_instance = None
+# Model-specific settings
+big_model_settings = _SHARED_MODEL_SETTINGS
+small_model_settings = _SHARED_MODEL_SETTINGS
 
 
+@cache
 def get_external_client() -> AsyncOpenAI:
-    global _external_client_instance
-    if _external_client_instance is None:
-        api_key_to_use = os.getenv("OPENAI_API_KEY")
-        if api_key_to_use is None:
-            api_key_to_use = os.getenv(
-                "TEST_DUMMY_API_KEY", "dummy_for_local_if_no_env_set"
-            )
-
-        base_url = os.getenv("OPENAI_BASE_URL", "http://localhost:1234/v1")
-
-        _external_client_instance = AsyncOpenAI(
-            base_url=base_url, api_key=api_key_to_use
-        )
-    return _external_client_instance
+    return AsyncOpenAI(base_url=_BASE_URL, api_key=_API_KEY)
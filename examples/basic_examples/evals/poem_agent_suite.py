@@ -1,9 +1,19 @@
-poem_agent_test_suite = [
-    {
-        "id": "nature_poem",
-        "prompt": "Write a poem about the beauty of nature",
-    },
-]
+from typing import NamedTuple, Tuple
+
+
+class PoemCase(NamedTuple):
+    """A single poem-writing prompt."""
+
+    id: str
+    prompt: str
+
+
+poem_agent_test_suite: Tuple[PoemCase, ...] = (
+    PoemCase(
+        id="nature_poem",
+        prompt="Write a poem about the beauty of nature",
+    ),
+)
 
 poem_agent_criteria = [
     "The poem is exactly 50 lines long; count each line break as one line, excluding empty lines and any <think> tags or lines.",
@@ -1,35 +1,59 @@
-simple_greeting_test_suite = [
-    {
-        "id": "formal_title",
-        "prompt": "Dr. Johnson",
-        "expected_keywords": ["Dr. Johnson", "pleasure", "acquaintance", "Good day"],
-    },
-    {
-        "id": "informal_name",
-        "prompt": "Alice",
-        "expected_keywords": ["Alice", "Hello", "Hi", "great", "welcome"],
-    },
-    {
-        "id": "mr_title",
-        "prompt": "Mr. Williams",
-        "expected_keywords": ["Mr. Williams", "pleasure", "Good day", "acquaintance"],
-    },
-    {
-        "id": "ms_title",
-        "prompt": "Ms. Davis",
-        "expected_keywords": ["Ms. Davis", "pleasure", "Good day", "acquaintance"],
-    },
-    {
-        "id": "simple_name",
-        "prompt": "Bob",
-        "expected_keywords": ["Bob", "Hello", "Hi", "great", "welcome"],
-    },
-    {
-        "id": "professor_title",
-        "prompt": "Professor Brown",
-        "expected_keywords": ["Professor Brown", "pleasure", "Good day", "acquaintance"],
-    },
-]
+from typing import NamedTuple, Tuple
+
+# Keywords shared across cases
+_PLEASURE = "pleasure"
+_ACQUAINTANCE = "acquaintance"
+_GOOD_DAY = "Good day"
+_HELLO = "Hello"
+_HI = "Hi"
+_GREAT = "great"
+_WELCOME = "welcome"
+
+# Keyword sets shared by every formal (titled) and informal (first-name) case
+_FORMAL_KEYWORDS = (_PLEASURE, _GOOD_DAY, _ACQUAINTANCE)
+_INFORMAL_KEYWORDS = (_HELLO, _HI, _GREAT, _WELCOME)
+
+
+class GreetingCase(NamedTuple):
+    """A name to greet and the keywords a good greeting should contain."""
+
+    id: str
+    prompt: str
+    expected_keywords: Tuple[str, ...]
+
+
+simple_greeting_test_suite: Tuple[GreetingCase, ...] = (
+    GreetingCase(
+        id="formal_title",
+        prompt="Dr. Johnson",
+        expected_keywords=("Dr. Johnson", *_FORMAL_KEYWORDS),
+    ),
+    GreetingCase(
+        id="informal_name",
+        prompt="Alice",
+        expected_keywords=("Alice", *_INFORMAL_KEYWORDS),
+    ),
+    GreetingCase(
+        id="mr_title",
+        prompt="Mr. Williams",
+        expected_keywords=("Mr. Williams", *_FORMAL_KEYWORDS),
+    ),
+    GreetingCase(
+        id="ms_title",
+        prompt="Ms. Davis",
+        expected_keywords=("Ms. Davis", *_FORMAL_KEYWORDS),
+    ),
+    GreetingCase(
+        id="simple_name",
+        prompt="Bob",
+        expected_keywords=("Bob", *_INFORMAL_KEYWORDS),
+    ),
+    GreetingCase(
+        id="professor_title",
+        prompt="Professor Brown",
+        expected_keywords=("Professor Brown", *_FORMAL_KEYWORDS),
+    ),
+)
 
 simple_greeting_criteria = [
     "The greeting includes the exact name provided in the prompt.",
@@ -1,7 +1,70 @@
-import json
-from datetime import datetime
+import ast
+from functools import lru_cache
+from types import CodeType, MappingProxyType
 from typing import Dict, List, Any
 
+from framework.utils import iso_now, json_dumps
+
+
+# Simulated weather data, keyed by city
+_WEATHER_DATA = MappingProxyType({
+    "New York": MappingProxyType({"temperature": 72, "condition": "sunny", "humidity": 65}),
+    "London": MappingProxyType({"temperature": 58, "condition": "cloudy", "humidity": 80}),
+    "Tokyo": MappingProxyType({"temperature": 75, "condition": "rainy", "humidity": 70}),
+    "Sydney": MappingProxyType({"temperature": 68, "condition": "partly cloudy", "humidity": 55}),
+    "Paris": MappingProxyType({"temperature": 62, "condition": "overcast", "humidity": 75})
+})
+
+# Simulated exchange rates, keyed by source then target currency
+_EXCHANGE_RATES = MappingProxyType({
+    "USD": MappingProxyType({"EUR": 0.85, "GBP": 0.73, "JPY": 110.0, "CAD": 1.25}),
+    "EUR": MappingProxyType({"USD": 1.18, "GBP": 0.86, "JPY": 129.0, "CAD": 1.47}),
+    "GBP": MappingProxyType({"USD": 1.37, "EUR": 1.16, "JPY": 150.0, "CAD": 1.71}),
+    "JPY": MappingProxyType({"USD": 0.009, "EUR": 0.0077, "GBP": 0.0067, "CAD": 0.011}),
+    "CAD": MappingProxyType({"USD": 0.80, "EUR": 0.68, "GBP": 0.58, "JPY": 88.0})
+})
+
+# Lookup keys reported back when a city or currency is not supported
+_AVAILABLE_CITIES = tuple(_WEATHER_DATA.keys())
+_SUPPORTED_CURRENCIES = tuple(_EXCHANGE_RATES.keys())
+
+# Characters permitted in calculator expressions; translating with this table
+# deletes them, so any leftover text means the expression has invalid characters.
+_CALCULATOR_CHARS_TABLE = str.maketrans("", "", "0123456789+-*/.() ")
+
+# Vocabulary for the simplified sentiment analysis in text_analyzer_tool
+_POSITIVE_WORDS = frozenset({'good', 'great', 'excellent', 'amazing', 'wonderful', 'happy'})
+_NEGATIVE_WORDS = frozenset({'bad', 'terrible', 'awful', 'horrible', 'sad', 'angry'})
+
+# Syntax permitted in calculator expressions: numeric literals combined with
+# arithmetic operators. Anything else (names, calls, attributes, ...) is rejected.
+_ALLOWED_EXPRESSION_NODES = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Constant,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Pow,
+    ast.UAdd,
+    ast.USub,
+)
+
+
+@lru_cache(maxsize=256)
+def _compile_expression(expression: str) -> CodeType:
+    """Parse, validate and compile an arithmetic expression once per distinct input."""
+    tree = ast.parse(expression, mode="eval")
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_EXPRESSION_NODES):
+            raise ValueError(f"unsupported syntax '{type(node).__name__}'")
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+            raise ValueError(f"unsupported literal {node.value!r}")
+    return compile(tree, "<calculator>", "eval")
+
 
 def calculator_tool(expression: str) -> str:
     """Evaluates mathematical expressions safely."""
@@ -10,29 +73,28 @@ def calculator_tool(expression: str) -> str:
         expression = expression.strip()
         
         # Basic safety check - only allow basic math operations
-        allowed_chars = set('0123456789+-*/.() ')
-        if not all(c in allowed_chars for c in expression):
-            return json.dumps({
+        if expression.translate(_CALCULATOR_CHARS_TABLE):
+            return json_dumps({
                 "error": "Expression contains invalid characters. Only basic math operations (+, -, *, /, .) and parentheses are allowed.",
                 "expression": expression
             })
         
-        # Evaluate the expression
-        result = eval(expression)
+        # Evaluate the validated, pre-compiled expression without builtins
+        result = eval(_compile_expression(expression), {"__builtins__": {}}, {})
         
-        return json.dumps({
+        return json_dumps({
             "expression": expression,
             "result": result,
             "calculation_steps": f"Evaluated: {expression} = {result}",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": iso_now()
         })
     except ZeroDivisionError:
-        return json.dumps({
+        return json_dumps({
             "error": "Division by zero is not allowed",
             "expression": expression
         })
     except Exception as e:
-        return json.dumps({
+        return json_dumps({
             "error": f"Error evaluating expression: {str(e)}",
             "expression": expression
         })
@@ -40,71 +102,59 @@ def calculator_tool(expression: str) -> str:
 
 def weather_lookup_tool(city: str) -> str:
     """Simulates a weather lookup for a given city."""
-    # Simulated weather data
-    weather_data = {
-        "New York": {"temperature": 72, "condition": "sunny", "humidity": 65},
-        "London": {"temperature": 58, "condition": "cloudy", "humidity": 80},
-        "Tokyo": {"temperature": 75, "condition": "rainy", "humidity": 70},
-        "Sydney": {"temperature": 68, "condition": "partly cloudy", "humidity": 55},
-        "Paris": {"temperature": 62, "condition": "overcast", "humidity": 75}
-    }
-    
-    if city in weather_data:
-        data = weather_data[city]
-        return json.dumps({
+    if city in _WEATHER_DATA:
+        data = _WEATHER_DATA[city]
+        return json_dumps({
             "city": city,
             "temperature": data["temperature"],
             "condition": data["condition"],
             "humidity": data["humidity"],
-            "timestamp": datetime.now().isoformat()
+            "timestamp": iso_now()
         })
     else:
-        return json.dumps({
+        return json_dumps({
             "error": f"Weather data not available for {city}",
-            "available_cities": list(weather_data.keys())
+            "available_cities": _AVAILABLE_CITIES
         })
 
 
 def currency_converter_tool(amount: float, from_currency: str, to_currency: str) -> str:
     """Simulates currency conversion."""
-    # Simulated exchange rates
-    rates = {
-        "USD": {"EUR": 0.85, "GBP": 0.73, "JPY": 110.0, "CAD": 1.25},
-        "EUR": {"USD": 1.18, "GBP": 0.86, "JPY": 129.0, "CAD": 1.47},
-        "GBP": {"USD": 1.37, "EUR": 1.16, "JPY": 150.0, "CAD": 1.71},
-        "JPY": {"USD": 0.009, "EUR": 0.0077, "GBP": 0.0067, "CAD": 0.011},
-        "CAD": {"USD": 0.80, "EUR": 0.68, "GBP": 0.58, "JPY": 88.0}
-    }
-    
-    if from_currency in rates and to_currency in rates[from_currency]:
-        converted_amount = amount * rates[from_currency][to_currency]
-        return json.dumps({
+    if from_currency in _EXCHANGE_RATES and to_currency in _EXCHANGE_RATES[from_currency]:
+        rate = _EXCHANGE_RATES[from_currency][to_currency]
+        converted_amount = amount * rate
+        return json_dumps({
             "original_amount": amount,
             "from_currency": from_currency,
             "to_currency": to_currency,
             "converted_amount": round(converted_amount, 2),
-            "exchange_rate": rates[from_currency][to_currency],
-            "timestamp": datetime.now().isoformat()
+            "exchange_rate": rate,
+            "timestamp": iso_now()
         })
     else:
-        return json.dumps({
+        return json_dumps({
             "error": f"Conversion not available from {from_currency} to {to_currency}",
-            "supported_currencies": list(rates.keys())
+            "supported_currencies": _SUPPORTED_CURRENCIES
         })
 
 
 def text_analyzer_tool(text: str) -> str:
     """Analyzes text and provides basic statistics."""
     words = text.split()
-    sentences = text.split('.')
+    sentence_count = sum(1 for sentence in text.split('.') if sentence.strip())
     characters = len(text)
     
-    # Basic sentiment analysis (simplified)
-    positive_words = ['good', 'great', 'excellent', 'amazing', 'wonderful', 'happy']
-    negative_words = ['bad', 'terrible', 'awful', 'horrible', 'sad', 'angry']
-    
-    positive_count = sum(1 for word in words if word.lower() in positive_words)
-    negative_count = sum(1 for word in words if word.lower() in negative_words)
+    # Basic sentiment analysis (simplified), gathered in a single pass over the words
+    total_word_length = 0
+    positive_count = 0
+    negative_count = 0
+    for word in words:
+        total_word_length += len(word)
+        lowered = word.lower()
+        if lowered in _POSITIVE_WORDS:
+            positive_count += 1
+        elif lowered in _NEGATIVE_WORDS:
+            negative_count += 1
     
     if positive_count > negative_count:
         sentiment = "positive"
@@ -113,13 +163,13 @@ def text_analyzer_tool(text: str) -> str:
     else:
         sentiment = "neutral"
     
-    return json.dumps({
+    return json_dumps({
         "word_count": len(words),
-        "sentence_count": len([s for s in sentences if s.strip()]),
+        "sentence_count": sentence_count,
         "character_count": characters,
-        "average_word_length": round(sum(len(word) for word in words) / len(words), 2) if words else 0,
+        "average_word_length": round(total_word_length / len(words), 2) if words else 0,
         "sentiment": sentiment,
         "positive_words": positive_count,
         "negative_words": negative_count,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": iso_now()
     }) 
\ No newline at end of file
@@ -41,9 +41,9 @@ question_generator_test_suite = [
     },
 ]
 
-question_generator_criteria = [
+question_generator_criteria = (
     "The output is a valid JSON object with exactly one key 'questions' containing a list of strings.",
     "The 'questions' list contains exactly 3 questions.",
     "Each question is relevant to the research topic, clear and specific, different from the others, and phrased as an answerable research question.",
     "No extra fields are present beyond 'questions'.",
-]
+)
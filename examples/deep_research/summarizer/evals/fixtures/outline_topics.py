@@ -0,0 +1,25 @@
+"""Research topics shared by the summarizer eval suites.
+
+Kept beside its JSON data rather than in `evals/`, where every module is a
+candidate eval suite.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, NamedTuple, Tuple
+
+
+class Topic(NamedTuple):
+    """A research topic and the knowledge gathered for it."""
+
+    research_topic: str
+    gathered_knowledge: Tuple[str, ...]
+
+
+def load_topics() -> Dict[str, Topic]:
+    """Read the topic table from outline_topics.json, keyed by topic slug."""
+    rows = json.loads(Path(__file__).with_name("outline_topics.json").read_text(encoding="utf-8"))
+    return {
+        key: Topic(row["research_topic"], tuple(row["gathered_knowledge"]))
+        for key, row in rows.items()
+    }
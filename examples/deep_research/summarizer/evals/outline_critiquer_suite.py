@@ -1,51 +1,196 @@
-outline_critiquer_test_suite = [
-    {
-        "id": "critique_weak_outline_1",
-        "prompt": '{"research_topic": "The impact of artificial intelligence on healthcare delivery in the United States", "initial_outline": ["AI", "Healthcare", "Benefits", "Problems", "End"], "gathered_knowledge": [{"content": "AI applications in healthcare include diagnostic imaging, drug discovery, electronic health records, telemedicine, and predictive analytics. Key findings show improved diagnostic accuracy, reduced costs, and enhanced patient outcomes. Challenges include data privacy, regulatory compliance, and workforce displacement. Major implementations include IBM Watson, Google DeepMind, and various FDA-approved AI diagnostic tools."}]}',
-    },
-    {
-        "id": "critique_good_outline_1",
-        "prompt": '{"research_topic": "The economic effects of renewable energy adoption in Germany", "initial_outline": ["Introduction to Germany\'s Renewable Energy Transition", "Economic Benefits: Job Creation and Export Growth", "Economic Challenges: Energy Costs and Grid Stability", "Impact on Industrial Competitiveness", "Conclusion and Future Outlook"], "gathered_knowledge": [{"content": "Germany\'s renewable energy transition (Energiewende) has created jobs in solar and wind sectors, reduced energy imports, and increased energy costs for consumers. The policy has driven technological innovation and positioned Germany as a leader in clean energy exports. However, grid stability and industrial competitiveness remain challenges."}]}',
-    },
-    {
-        "id": "critique_redundant_outline_1",
-        "prompt": '{"research_topic": "The psychological impacts of social media on adolescent mental health", "initial_outline": ["Social Media and Mental Health", "Effects on Teenagers", "Psychological Impacts", "Mental Health Issues", "Social Media Problems", "Teen Psychology"], "gathered_knowledge": [{"content": "Research shows correlations between excessive social media use and increased rates of anxiety, depression, and sleep disorders among teenagers. Platform design features like infinite scroll and push notifications contribute to addictive behaviors. Positive aspects include social connection and access to mental health resources."}]}',
-    },
-    {
-        "id": "critique_missing_sections_1",
-        "prompt": '{"research_topic": "The evolution of cybersecurity threats in the banking sector", "initial_outline": ["Introduction", "Common Threats", "Conclusion"], "gathered_knowledge": [{"content": "Banking cybersecurity has evolved from basic password protection to multi-factor authentication, AI-powered fraud detection, and blockchain security. Common threats include phishing, ransomware, and insider attacks. Financial institutions invest heavily in security infrastructure and regulatory compliance. Historical evolution shows progression from physical security to digital threats."}]}',
-    },
-    {
-        "id": "critique_user_specified_structure_1",
-        "prompt": '{"research_topic": "The effectiveness of remote work policies on employee productivity", "user_requirement": "Please structure this as a three-section report focusing on productivity metrics, challenges, and recommendations.", "initial_outline": ["Introduction", "Benefits of Remote Work", "Productivity Studies", "Management Challenges", "Technology Infrastructure", "Employee Characteristics", "Hybrid Models", "Conclusion"], "gathered_knowledge": [{"content": "Studies show mixed results on remote work productivity, with some reporting 13-50% increases and others noting decreased collaboration and innovation. Factors affecting success include management practices, technology infrastructure, and employee characteristics. Hybrid models are emerging as popular compromises."}]}',
-    },
-    {
-        "id": "critique_three_section_climate_change",
-        "prompt": '{"research_topic": "A three-section structured report on the causes of climate change, focusing on natural mechanisms, human-driven factors, and feedback loops, designed to provide actionable insights for educational or policy applications.", "initial_outline": ["Introduction: Contextualizing Climate Change Causes and Research Objectives", "Natural Mechanisms of Climate Change: Solar Radiation, Ocean Currents, and Feedback Loops", "Human Activities Driving Climate Change: Deforestation, Fossil Fuels, and Land Use", "Regional Case Studies: Arctic, Amazon, and Global Impacts", "Methodological Frameworks for Actionable Insights: Models, Policy Analysis, and Scenario Comparisons", "Trade-Off Evaluation: Regional Mitigation Strategies vs. Global Sustainability Goals", "Conclusion: Synthesizing Findings and Future Research Directions"], "gathered_knowledge": "[{ \"question_id\": 0, \"content\": \"Natural mechanisms like solar radiation and ocean currents contribute significantly to climate change through complex feedback loops, though their impact is often overshadowed by human activities. Recent studies suggest that variations in solar output account for ~20% of observed warming since the 1970s, while ocean current shifts, such as the Atlantic Meridional Overturning Circulation (AMOC), amplify regional climate variability. Human activities, including deforestation and fossil fuel use, remain critical drivers, but their role is frequently misrepresented in policy debates. A 2022 Nature Climate Analysis study highlights that natural factors alone cannot explain current trends without incorporating anthropogenic variables.\", \"source\": \"made-up-for-testing\", \"url\": \"made-up-for-testing\", \"query\": \"How do natural mechanisms like solar radiation and ocean currents contribute to climate change compared to human activities such as deforestation and fossil fuel use?\"}, {\"question_id\": 1, \"content\": \"Focusing on specific regions like the Arctic and Amazon provides critical insights into localized climate impacts. The Arctic exemplifies rapid warming trends and feedback loops from ice-albedo effects, while the Amazon highlights biodiversity loss and carbon sink dynamics. A regional focus allows for targeted policy recommendations, though generalizing findings requires careful consideration of broader ecological and socio-economic contexts.\", \"source\": \"made-up-for-testing\", \"url\": \"made-up-for-testing\", \"query\": \"Should the analysis focus on specific regions (e.g., Arctic, Amazon) or remain general in scope?\"}, {\"question_id\": 2, \"content\": \"A mixed-methods approach combining climate modeling simulations with policy analysis frameworks offers the most actionable insights. Models like IPCC scenarios provide quantitative projections for educational contexts, while policy analysis tools (e.g., cost-benefit analysis, vulnerability assessments) enable evidence-based policymaking. For educational purposes, interactive models enhance understanding of feedback loops, whereas policymakers benefit from scenario comparisons to evaluate mitigation strategies.\", \"source\": \"made-up-for-testing\", \"url\": \"made-up-for-testing\", \"query\": \"What methodological approach (e.g., comparative case studies, models, or policy analysis) would best address actionable insights for educational or policy purposes?\"}, {\"question_id\": 0, \"content\": \"IPCC scenarios may exhibit limitations such as over-reliance on economic growth assumptions, limited regional granularity for localized policy needs, and potential biases in representing non-market impacts (e.g., biodiversity loss). Additionally, they often prioritize well-studied variables like CO2 emissions while underrepresenting feedback loops (e.g., permafrost thaw) or abrupt climate events, which can skew policy recommendations toward gradualist approaches rather than transformative action.\", \"source\": \"made-up-for-testing\", \"url\": \"made-up-for-testing\", \"query\": \"What specific limitations or biases exist in using IPCC scenarios for policy analysis related to climate change causes?\"}, {\"question_id\": 1, \"content\": \"Vulnerability assessments differ in their methodological focus, data priorities, and analytical frameworks depending on whether they target natural mechanisms (e.g., climate variability, ecological thresholds) or human-driven factors (e.g., land-use change, socioeconomic disparities). For natural mechanisms, assessments often emphasize predictive modeling of physical systems, remote sensing, and long-term environmental datasets to quantify exposure and adaptive capacity. In contrast, human-driven evaluations prioritize participatory methodologies, surveys, and socio-economic indicators to capture power dynamics, governance structures, and equity considerations.\", \"source\": \"made-up-for-testing\", \"url\": \"made-up-for-testing\", \"query\": \"How do vulnerability assessments differ in application when evaluating natural mechanisms versus human-driven factors in regional case studies?\"}, {\"question_id\": 0, \"content\": \"Integrating regional vulnerability assessments with global climate models faces methodological challenges including spatial-temporal scale mismatches, data resolution limitations, and inconsistent parameterization of socio-economic factors. Regional assessments often require high-resolution local data (e.g., community-level demographics, land-use patterns) that conflict with the coarse spatial granularity of global models, necessitating downscaling techniques that introduce uncertainty.\", \"source\": \"made-up-for-testing\", \"url\": \"made-up-for-testing\", \"query\": \"What are the methodological challenges in integrating regional vulnerability assessments with global climate models for policy applications?\"}, {\"question_id\": 1, \"content\": \"Socio-economic factors moderate natural climate variability impacts through mechanisms like resource distribution equity, institutional capacity, and adaptive livelihoods. For instance, low-income communities often lack infrastructure to mitigate extreme weather effects, exacerbating vulnerabilities despite similar climatic conditions. Conversely, regions with robust governance structures can implement early warning systems or zoning laws that buffer against climate shocks.\", \"source\": \"made-up-for-testing\", \"url\": \"made-up-for-testing\", \"query\": \"How do socio-economic factors moderate the impact of natural climate variability on policy-relevant outcomes?\"}, {\"question_id\": 2, \"content\": \"The Dynamic Regional Sustainability Framework (DRSF) evaluates trade-offs by integrating economic, environmental, and social metrics across spatial scales. It incorporates scenario modeling to compare localized mitigation outcomes (e.g., renewable energy adoption in Southeast Asia) against global targets like the SDGs. A key component is its \'policy flexibility index,\' which quantifies how well region-specific strategies align with global equity principles while addressing unique socio-economic contexts.\", \"source\": \"made-up-for-testing\", \"url\": \"made-up-for-testing\", \"query\": \"What frameworks exist to evaluate the trade-offs between region-specific mitigation strategies and global sustainability goals?\"}]"}',
-    },
-    {
-        "id": "critique_comprehensive_outline_1",
-        "prompt": '{"research_topic": "The impact of climate change on global food security", "initial_outline": ["Climate Change Overview", "Effects on Agricultural Production", "Regional Vulnerabilities", "Adaptation Strategies", "Economic and Social Impacts", "Policy Recommendations", "Conclusion"], "gathered_knowledge": [{"content": "Climate change affects food production through changing precipitation patterns, extreme weather events, and rising temperatures. Vulnerable regions include sub-Saharan Africa and South Asia. Adaptation strategies include drought-resistant crops, improved irrigation, and diversified farming systems. Food prices and availability are increasingly affected."}]}',
-    },
-    {
-        "id": "critique_technical_outline_1",
-        "prompt": '{"research_topic": "The role of blockchain technology in supply chain management", "initial_outline": ["Blockchain Technology", "Supply Chain Applications", "Benefits and Challenges", "Implementation Examples"], "gathered_knowledge": [{"content": "Blockchain provides transparency, traceability, and immutable records in supply chains. Benefits include reduced fraud, improved food safety, and enhanced sustainability tracking. Challenges include scalability, energy consumption, and integration with existing systems. Major companies like Walmart and Maersk have implemented blockchain solutions."}]}',
-    },
-    {
-        "id": "critique_empty_outline_1",
-        "prompt": '{"research_topic": "The development of autonomous vehicles and their impact on transportation", "initial_outline": [], "gathered_knowledge": [{"content": "Autonomous vehicle technology ranges from Level 1 (driver assistance) to Level 5 (full automation). Current deployments focus on specific use cases like highway driving and ride-sharing. Impacts include potential reduction in traffic accidents, changes in urban planning, and job displacement for drivers. Regulatory frameworks are still evolving."}]}',
-    },
-    {
-        "id": "critique_medical_outline_1",
-        "prompt": '{"research_topic": "The effectiveness of mindfulness meditation in treating anxiety disorders", "initial_outline": ["Introduction to Mindfulness", "Research on Anxiety Treatment", "Clinical Applications", "Mechanisms of Action", "Limitations and Considerations", "Conclusion"], "gathered_knowledge": [{"content": "Clinical studies show mindfulness-based interventions reduce anxiety symptoms by 20-30% on average. Mechanisms include improved emotional regulation, reduced rumination, and enhanced present-moment awareness. Mindfulness-Based Stress Reduction (MBSR) and Mindfulness-Based Cognitive Therapy (MBCT) are evidence-based approaches."}]}',
-    },
-    {
-        "id": "critique_social_media_outline_1",
-        "prompt": '{"research_topic": "The influence of social media algorithms on political polarization", "initial_outline": ["Social Media Basics", "Algorithm Functionality", "Political Effects", "Echo Chambers", "Polarization Trends", "Platform Responses", "Future Implications"], "gathered_knowledge": [{"content": "Social media algorithms create echo chambers by showing users content similar to their past interactions. This can reinforce existing beliefs and reduce exposure to diverse viewpoints. Research indicates increased political polarization correlates with social media usage. Some platforms have implemented measures to promote diverse content."}]}',
-    },
-]
-
-outline_critiquer_criteria = [
+import json
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional, Sequence, Tuple
+
+from examples.deep_research.summarizer.evals.fixtures.outline_topics import load_topics
+
+# Long prompts live in sibling fixture files to keep this module readable
+_FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def _read_fixture(name: str) -> str:
+    return (_FIXTURES_DIR / name).read_text(encoding="utf-8")
+
+
+# Topic table shared with the initial outline generator suite
+_TOPICS = load_topics()
+
+
+def _critique_prompt(
+    topic_key: str,
+    initial_outline: Sequence[str],
+    user_requirement: Optional[str] = None,
+    gathered_knowledge: Optional[Sequence[str]] = None,
+) -> str:
+    """Serialise an outline and its research context into the JSON prompt the agent expects.
+
+    `gathered_knowledge` defaults to the shared topic's knowledge.
+    """
+    topic = _TOPICS[topic_key]
+    if gathered_knowledge is None:
+        gathered_knowledge = topic.gathered_knowledge
+    payload: Dict[str, Any] = {"research_topic": topic.research_topic}
+    if user_requirement is not None:
+        payload["user_requirement"] = user_requirement
+    payload["initial_outline"] = initial_outline
+    payload["gathered_knowledge"] = [{"content": content} for content in gathered_knowledge]
+    return json.dumps(payload)
+
+
+class CritiqueCase(NamedTuple):
+    """An initial outline for the critiquer to review and revise."""
+
+    id: str
+    prompt: str
+
+
+outline_critiquer_test_suite: Tuple[CritiqueCase, ...] = (
+    CritiqueCase(
+        id="critique_weak_outline_1",
+        prompt=_critique_prompt(
+            "ai_healthcare",
+            initial_outline=(
+                "AI",
+                "Healthcare",
+                "Benefits",
+                "Problems",
+                "End",
+            ),
+            gathered_knowledge=(
+                "AI applications in healthcare include diagnostic imaging, drug discovery, electronic health records, telemedicine, and predictive analytics. Key findings show improved diagnostic accuracy, reduced costs, and enhanced patient outcomes. Challenges include data privacy, regulatory compliance, and workforce displacement. Major implementations include IBM Watson, Google DeepMind, and various FDA-approved AI diagnostic tools.",
+            ),
+        ),
+    ),
+    CritiqueCase(
+        id="critique_good_outline_1",
+        prompt=_critique_prompt(
+            "germany_renewables",
+            initial_outline=(
+                "Introduction to Germany's Renewable Energy Transition",
+                "Economic Benefits: Job Creation and Export Growth",
+                "Economic Challenges: Energy Costs and Grid Stability",
+                "Impact on Industrial Competitiveness",
+                "Conclusion and Future Outlook",
+            ),
+        ),
+    ),
+    CritiqueCase(
+        id="critique_redundant_outline_1",
+        prompt=_critique_prompt(
+            "social_media_adolescents",
+            initial_outline=(
+                "Social Media and Mental Health",
+                "Effects on Teenagers",
+                "Psychological Impacts",
+                "Mental Health Issues",
+                "Social Media Problems",
+                "Teen Psychology",
+            ),
+        ),
+    ),
+    CritiqueCase(
+        id="critique_missing_sections_1",
+        prompt=_critique_prompt(
+            "banking_cybersecurity",
+            initial_outline=(
+                "Introduction",
+                "Common Threats",
+                "Conclusion",
+            ),
+            gathered_knowledge=(
+                "Banking cybersecurity has evolved from basic password protection to multi-factor authentication, AI-powered fraud detection, and blockchain security. Common threats include phishing, ransomware, and insider attacks. Financial institutions invest heavily in security infrastructure and regulatory compliance. Historical evolution shows progression from physical security to digital threats.",
+            ),
+        ),
+    ),
+    CritiqueCase(
+        id="critique_user_specified_structure_1",
+        prompt=_critique_prompt(
+            "remote_work",
+            user_requirement="Please structure this as a three-section report focusing on productivity metrics, challenges, and recommendations.",
+            initial_outline=(
+                "Introduction",
+                "Benefits of Remote Work",
+                "Productivity Studies",
+                "Management Challenges",
+                "Technology Infrastructure",
+                "Employee Characteristics",
+                "Hybrid Models",
+                "Conclusion",
+            ),
+        ),
+    ),
+    CritiqueCase(
+        id="critique_three_section_climate_change",
+        # Gathered knowledge arrives here as raw researcher output rather than
+        # content objects, so the prompt is kept verbatim.
+        prompt=_read_fixture("critique_three_section_climate_change.txt"),
+    ),
+    CritiqueCase(
+        id="critique_comprehensive_outline_1",
+        prompt=_critique_prompt(
+            "climate_food_security",
+            initial_outline=(
+                "Climate Change Overview",
+                "Effects on Agricultural Production",
+                "Regional Vulnerabilities",
+                "Adaptation Strategies",
+                "Economic and Social Impacts",
+                "Policy Recommendations",
+                "Conclusion",
+            ),
+        ),
+    ),
+    CritiqueCase(
+        id="critique_technical_outline_1",
+        prompt=_critique_prompt(
+            "blockchain_supply_chain",
+            initial_outline=(
+                "Blockchain Technology",
+                "Supply Chain Applications",
+                "Benefits and Challenges",
+                "Implementation Examples",
+            ),
+        ),
+    ),
+    CritiqueCase(
+        id="critique_empty_outline_1",
+        prompt=_critique_prompt(
+            "autonomous_vehicles",
+            initial_outline=(),
+        ),
+    ),
+    CritiqueCase(
+        id="critique_medical_outline_1",
+        prompt=_critique_prompt(
+            "mindfulness_anxiety",
+            initial_outline=(
+                "Introduction to Mindfulness",
+                "Research on Anxiety Treatment",
+                "Clinical Applications",
+                "Mechanisms of Action",
+                "Limitations and Considerations",
+                "Conclusion",
+            ),
+        ),
+    ),
+    CritiqueCase(
+        id="critique_social_media_outline_1",
+        prompt=_critique_prompt(
+            "algorithms_polarization",
+            initial_outline=(
+                "Social Media Basics",
+                "Algorithm Functionality",
+                "Political Effects",
+                "Echo Chambers",
+                "Polarization Trends",
+                "Platform Responses",
+                "Future Implications",
+            ),
+        ),
+    ),
+)
+
+outline_critiquer_criteria = (
     "The output is a valid JSON object with exactly two keys: 'state_name' and 'revised_outline'.",
     "The 'state_name' field is exactly 'ready_for_expansion'.",
     "The 'revised_outline' list contains between 3 and 8 sections.",
@@ -55,4 +200,4 @@ outline_critiquer_criteria = [
     "The revised outline demonstrates clear logical progression (sections build upon each other; appropriate introduction → main content → conclusion ordering; no illogical ordering).",
     "Section titles are clear, descriptive, professional, specific, and free of redundancy or overlap.",
     "Edge cases are handled appropriately: empty initial outlines yield a complete new outline; severely flawed outlines are substantially restructured; good outlines receive minor improvements or are kept largely intact.",
-]
+)
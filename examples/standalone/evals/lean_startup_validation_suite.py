@@ -1,11 +1,33 @@
-lean_startup_validation_test_suite = [
-    {
-        "id": "smart_experiments_dinosaur_popsicle",
-        "prompt": "dinosaur popsicle",
-    }
-]
-
-lean_startup_validation_criteria = [
+from typing import NamedTuple, Tuple
+
+
+class ValidationCase(NamedTuple):
+    """A product idea to build a validation plan for."""
+
+    id: str
+    prompt: str
+
+
+lean_startup_validation_test_suite: Tuple[ValidationCase, ...] = (
+    ValidationCase(
+        id="smart_experiments_dinosaur_popsicle",
+        prompt="dinosaur popsicle",
+    ),
+    ValidationCase(
+        id="smart_experiments_space_jellyfish",
+        prompt="space jellyfish",
+    ),
+    ValidationCase(
+        id="smart_experiments_origami_drone",
+        prompt="origami drone",
+    ),
+    ValidationCase(
+        id="smart_experiments_glow_in_the_dark_umbrella",
+        prompt="glow-in-the-dark umbrella",
+    ),
+)
+
+lean_startup_validation_criteria = (
     "The output contains 'validation_plan.experiments' as a non-empty list with at least 2 distinct experiments.",
     "Each experiment has a clear 'objective' that states exactly what learning it targets and is traceable to a specific hypothesis or riskiest assumption.",
     "Each experiment specifies a 'metric' and a 'success_criteria' with an explicit numeric threshold or unambiguous comparator (e.g., '>= 15 signups', 'conversion >= 5%', 'at least 8/10 report X').",
@@ -13,6 +35,6 @@ lean_startup_validation_criteria = [
     "Experiments collectively focus on validating the top 1–2 riskiest assumptions first, with at least one experiment directly testing demand or strong problem validation.",
     "Each experiment includes 'timeline_days' as a positive integer with a short duration (ideally ≤ 14 days).",
     "Internal consistency: 'success_criteria' aligns with the 'metric' and the experiment's 'objective', and plan-level criteria do not contradict experiment thresholds.",
-]
+)
 
 
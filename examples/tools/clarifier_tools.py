@@ -1,8 +1,7 @@
-import json
+from framework.utils import iso_now, json_dumps
 
 # Import the GPT-4o search helper located in the same examples package.
 from .gpt4o_search_tool import GPT4OSearchTool
-from datetime import datetime, timezone
 
 # def get_current_topic_tool():
 #     """Gets the current research topic from context. Returns None if no topic is set."""
@@ -15,7 +14,7 @@ from datetime import datetime, timezone
 
 def user_input_tool(prompt_message: str):
     user_input = input(prompt_message + " ").strip()
-    return json.dumps({"user_input": user_input})
+    return json_dumps({"user_input": user_input})
 
 
 # -----------------------------------------------------------------------------
@@ -33,7 +32,7 @@ async def search_topic_context_tool(search_query: str) -> str:
         "sources": sources,
     }
 
-    return json.dumps(payload, ensure_ascii=False)
+    return json_dumps(payload)
 
 
 # -----------------------------------------------------------------------------
@@ -42,5 +41,4 @@ async def search_topic_context_tool(search_query: str) -> str:
 
 
 def get_current_datetime_tool() -> str:
-    now = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
-    return json.dumps({"current_datetime": now})
+    return json_dumps({"current_datetime": iso_now(utc=True)})
@@ -1,6 +1,12 @@
+import asyncio
+import functools
+import importlib.util
 import re
-from openai import OpenAI
-from typing import Tuple, List, TypedDict
+import time
+from collections import OrderedDict
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+from typing import Dict, Tuple, List, TypedDict
 
 
 class Source(TypedDict):
@@ -8,6 +14,66 @@ class Source(TypedDict):
     url: str
 
 
+# Process-wide LRU of recent searches keyed by (query, search_context_size).
+# Agents often repeat a query when retrying or refining; entries expire so
+# long-running processes still see fresh results.
+_SEARCH_CACHE_MAX_ENTRIES = 256
+_SEARCH_CACHE_TTL_SECONDS = 3600.0
+_search_cache: "OrderedDict[Tuple[str, str], Tuple[float, str, List[Source]]]" = OrderedDict()
+
+# Markdown links: [text](url)
+_MD_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+
+# Keep enough warm connections for parallel agent searches. HTTP/2 lets those
+# searches share one connection, but needs the optional `h2` package.
+_HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class _RequestPacer:
+    """Token-bucket pacing (GCRA) for requests against a per-minute budget.
+
+    Up to `burst` requests go out immediately; after that they are spaced so the
+    rate never exceeds `requests_per_minute`. Reservation is synchronous, so
+    concurrent callers on the event loop queue in arrival order without a lock.
+    """
+
+    def __init__(self, requests_per_minute: int, burst: int) -> None:
+        self._interval = 60.0 / requests_per_minute
+        self._burst_window = (burst - 1) * self._interval
+        self._theoretical_arrival = 0.0
+
+    async def wait(self) -> None:
+        now = time.monotonic()
+        arrival = max(self._theoretical_arrival, now)
+        self._theoretical_arrival = arrival + self._interval
+        delay = arrival - self._burst_window - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+# Pace searches below the endpoint's rate limit instead of colliding with 429s
+# and paying for retries; adjust to the account's RPM tier if needed.
+_SEARCH_REQUESTS_PER_MINUTE = 100
+_search_pacer = _RequestPacer(_SEARCH_REQUESTS_PER_MINUTE, burst=10)
+
+
+@functools.cache
+def _get_client() -> AsyncOpenAI:
+    """Create the async OpenAI client on first use.
+
+    One client per process, so every tool instance shares its connection pool.
+    """
+    return AsyncOpenAI(
+        http_client=DefaultAsyncHttpxClient(limits=_HTTP_LIMITS, http2=_HTTP2_AVAILABLE)
+    )
+
+
+def _copy_sources(sources: List[Source]) -> List[Source]:
+    """Copy each source so callers cannot modify the cached entries."""
+    return [Source(**source) for source in sources]
+
+
 class GPT4OSearchTool:
     """Simple wrapper around the GPT-4o *search-preview* endpoint.
 
@@ -17,7 +83,7 @@ class GPT4OSearchTool:
     """
 
     def __init__(self, search_context_size: str = "low"):
-        self.client = OpenAI()
+        self.client = _get_client()
         self.search_context_size = search_context_size
 
     # ---------------------------------------------------------------------
@@ -25,18 +91,12 @@ class GPT4OSearchTool:
     # ---------------------------------------------------------------------
     def _extract_sources_from_content(self, content: str) -> List[Source]:
         """Fallback regex extraction for sources when tool_calls are absent."""
-        # Regex to find markdown links: [text](url)
-        matches = re.findall(r"\[([^\]]+)\]\(([^)]+)\)", content)
-
-        sources: List[Source] = []
-        seen_urls: set[str] = set()
-
-        for title, url in matches:
-            if url not in seen_urls:
-                sources.append({"title": title, "url": url})
-                seen_urls.add(url)
+        # Keep the first title seen for each URL; dicts preserve insertion order
+        titles_by_url: Dict[str, str] = {}
+        for title, url in _MD_LINK_RE.findall(content):
+            titles_by_url.setdefault(url, title)
 
-        return sources
+        return [{"title": title, "url": url} for url, title in titles_by_url.items()]
 
     # ---------------------------------------------------------------------
     # Public API
@@ -50,8 +110,19 @@ class GPT4OSearchTool:
         Returns:
             Tuple of `(content, sources)` where `content` is the raw assistant
             message text and `sources` is a list of `{title, url}` dicts.
+            Repeated queries within the cache TTL are answered from memory.
         """
-        completion = self.client.chat.completions.create(
+        cache_key = (query, self.search_context_size)
+        cached = _search_cache.get(cache_key)
+        if cached is not None:
+            expires_at, cached_content, cached_sources = cached
+            if expires_at > time.monotonic():
+                _search_cache.move_to_end(cache_key)
+                return cached_content, _copy_sources(cached_sources)
+            del _search_cache[cache_key]
+
+        await _search_pacer.wait()
+        completion = await self.client.chat.completions.create(
             model="gpt-4o-search-preview",
             messages=[{"role": "user", "content": query}],
             web_search_options={"search_context_size": self.search_context_size},
@@ -71,4 +142,23 @@ class GPT4OSearchTool:
         if not sources:
             sources = self._extract_sources_from_content(content)
 
-        return content, sources
+        _search_cache[cache_key] = (
+            time.monotonic() + _SEARCH_CACHE_TTL_SECONDS,
+            content,
+            sources,
+        )
+        if len(_search_cache) > _SEARCH_CACHE_MAX_ENTRIES:
+            _search_cache.popitem(last=False)
+
+        return content, _copy_sources(sources)
+
+    async def search_batch(self, queries: List[str]) -> List[Tuple[str, List[Source]]]:
+        """Run several searches concurrently.
+
+        Each query still gets its own completion, so answers and citations stay
+        separate, but the round-trips overlap instead of running back to back.
+
+        Returns:
+            One `(content, sources)` tuple per query, in the order given.
+        """
+        return list(await asyncio.gather(*(self.search(query) for query in queries)))
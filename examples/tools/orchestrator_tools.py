@@ -4,6 +4,7 @@ Tools for the orchestrator agent to call other agents and manage workflows.
 
 import json
 from framework.declarative_agents import AgentLoader
+from framework.utils import json_dumps, json_loads
 
 
 async def call_description_agent(topic: str) -> str:
@@ -12,8 +13,8 @@ async def call_description_agent(topic: str) -> str:
     )
     result = await spec.run(topic)
     if isinstance(result, dict):
-        return json.dumps(result)
-    return json.dumps({"description": str(result), "mainCharacterName": "Unknown"})
+        return json_dumps(result)
+    return json_dumps({"description": str(result), "mainCharacterName": "Unknown"})
 
 
 async def call_story_agent(formatted_input: str) -> str:
@@ -22,13 +23,13 @@ async def call_story_agent(formatted_input: str) -> str:
     )
     result = await spec.run(formatted_input)
     if isinstance(result, dict):
-        return json.dumps(result)
-    return json.dumps({"outline": "Story outline", "story": str(result)})
+        return json_dumps(result)
+    return json_dumps({"outline": "Story outline", "story": str(result)})
 
 
 def format_story_input(description_json: str) -> str:
     try:
-        data = json.loads(description_json)
+        data = json_loads(description_json)
         description = data.get("description", "No description")
         character_name = data.get("mainCharacterName", "Unknown")
         return (
@@ -2,15 +2,59 @@
 Custom tools for saving research reports to the reports directory.
 """
 
+import asyncio
+import atexit
+import functools
+import multiprocessing
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import logging
 from datetime import datetime
-import markdown
-from weasyprint import HTML
+from typing import TYPE_CHECKING, Tuple
+
+# markdown and WeasyPrint (which pulls in Cairo and Pango) are imported on the
+# first PDF save, so markdown-only runs never pay for loading them
+if TYPE_CHECKING:
+    from weasyprint import CSS
+    from weasyprint.text.fonts import FontConfiguration
 
 logger = logging.getLogger(__name__)
 
+# Filename sanitising patterns, compiled once and shared by every save
+_UNSAFE_CHARS = re.compile(r'[<>:"/\\|?*]')
+_UNSAFE_CHARS_WITH_DOT = re.compile(r'[<>:"/\\|?*\.]')
+_WHITESPACE = re.compile(r'\s+')
+
+# Basic styling for better PDF appearance
+_PDF_CSS = """
+@page { size: A4; margin: 0.75in; }
+body { font-family: Arial, sans-serif; line-height: 1.6; }
+h1, h2, h3 { color: #333; }
+h1 { border-bottom: 2px solid #333; padding-bottom: 10px; }
+h2 { border-bottom: 1px solid #ccc; padding-bottom: 5px; }
+code { background-color: #f4f4f4; padding: 2px 4px; border-radius: 3px; }
+pre { background-color: #f4f4f4; padding: 10px; border-radius: 5px; overflow-x: auto; }
+table { border-collapse: collapse; width: 100%; }
+th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+th { background-color: #f2f2f2; }
+"""
+
+# Reports live under the working directory the process started in; resolving
+# it once spares every save a getcwd() call
+_REPORTS_DIR = Path("reports").absolute()
+
+# Upper bound on WeasyPrint worker processes; each one holds its own fonts and
+# Cairo state, so a few workers are enough for the reports saved per run
+_PDF_MAX_WORKERS = 4
+
+
+def _ensure_reports_dir() -> Path:
+    """Create the reports directory if it is missing and return its absolute path."""
+    _REPORTS_DIR.mkdir(exist_ok=True)
+    return _REPORTS_DIR
+
 def save_report_to_file(filename: str, content: str, report_type: str = "markdown") -> str:
     """
     Save a research report to the reports directory.
@@ -24,12 +68,11 @@ def save_report_to_file(filename: str, content: str, report_type: str = "markdow
         Success message with file path
     """
     # Ensure reports directory exists
-    reports_dir = Path("reports")
-    reports_dir.mkdir(exist_ok=True)
+    reports_dir = _ensure_reports_dir()
     
     # Sanitize filename - remove/replace unsafe characters
-    safe_filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    safe_filename = re.sub(r'\s+', '_', safe_filename)  # Replace spaces with underscores
+    safe_filename = _UNSAFE_CHARS.sub('_', filename)
+    safe_filename = _WHITESPACE.sub('_', safe_filename)  # Replace spaces with underscores
     safe_filename = safe_filename.strip('.')  # Remove leading/trailing dots
     
     # Ensure proper extension
@@ -44,10 +87,27 @@ def save_report_to_file(filename: str, content: str, report_type: str = "markdow
     with open(file_path, 'w', encoding='utf-8') as f:
         f.write(content)
     
-    absolute_path = file_path.absolute()
-    logger.info(f"Successfully saved report to: {absolute_path}")
+    logger.info(f"Successfully saved report to: {file_path}")
     
-    return f"Successfully saved report to: {absolute_path}"
+    return f"Successfully saved report to: {file_path}"
+
+
+async def save_report_to_file_async(filename: str, content: str, report_type: str = "markdown") -> str:
+    """
+    Async variant of `save_report_to_file` that writes from a worker thread.
+    
+    Prefer this from async code and as an agent tool, so the event loop keeps
+    serving other agents while the file is written.
+    
+    Args:
+        filename: The filename for the report (will be sanitized)
+        content: The content to write to the file
+        report_type: Type of report (markdown, pdf, etc.)
+    
+    Returns:
+        Success message with file path
+    """
+    return await asyncio.to_thread(save_report_to_file, filename, content, report_type)
 
 
 def create_timestamped_filename(topic: str, extension: str = "md") -> str:
@@ -62,8 +122,8 @@ def create_timestamped_filename(topic: str, extension: str = "md") -> str:
         Formatted filename with timestamp
     """
     # Clean up topic for filename
-    topic_clean = re.sub(r'[<>:"/\\|?*\.]', '', topic)
-    topic_clean = re.sub(r'\s+', '_', topic_clean)
+    topic_clean = _UNSAFE_CHARS_WITH_DOT.sub('', topic)
+    topic_clean = _WHITESPACE.sub('_', topic_clean)
     topic_clean = topic_clean[:50]  # Limit length
     
     # Get timestamp
@@ -79,40 +139,31 @@ def get_reports_directory_info() -> str:
     Returns:
         Information about the reports directory
     """
-    reports_dir = Path("reports")
+    reports_dir = _REPORTS_DIR
     if not reports_dir.exists():
         return "Reports directory does not exist yet. It will be created when the first report is saved."
     
-    files = [f.name for f in reports_dir.iterdir() if f.is_file()]
+    # DirEntry.is_file() uses the type cached from the directory listing, so
+    # this avoids a stat() call per entry.
+    with os.scandir(reports_dir) as entries:
+        files = [entry.name for entry in entries if entry.is_file()]
     file_count = len(files)
     
-    abs_path = reports_dir.absolute()
-    
     if files:
         file_list = "\n  ".join(files)
-        return f"Reports directory: {abs_path}\nFiles ({file_count}):\n  {file_list}"
+        return f"Reports directory: {reports_dir}\nFiles ({file_count}):\n  {file_list}"
     else:
-        return f"Reports directory: {abs_path}\nNo files found."
+        return f"Reports directory: {reports_dir}\nNo files found."
 
 
-def save_report_as_pdf(filename: str, markdown_content: str) -> str:
-    """
-    Convert markdown content to PDF and save to reports directory.
-    
-    Args:
-        filename: The filename for the PDF (will be sanitized)
-        markdown_content: The markdown content to convert
-    
-    Returns:
-        Success message with file path or error if PDF generation unavailable
-    """
+def _prepare_pdf(filename: str, markdown_content: str) -> Tuple[Path, str]:
+    """Sanitise the PDF filename and render the markdown to styled HTML."""
     # Ensure reports directory exists
-    reports_dir = Path("reports")
-    reports_dir.mkdir(exist_ok=True)
+    reports_dir = _ensure_reports_dir()
     
     # Sanitize filename
-    safe_filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    safe_filename = re.sub(r'\s+', '_', safe_filename)
+    safe_filename = _UNSAFE_CHARS.sub('_', filename)
+    safe_filename = _WHITESPACE.sub('_', safe_filename)
     safe_filename = safe_filename.strip('.')
     
     if not safe_filename.endswith('.pdf'):
@@ -120,27 +171,17 @@ def save_report_as_pdf(filename: str, markdown_content: str) -> str:
     
     file_path = reports_dir / safe_filename
     
+    import markdown
+    
     # Convert markdown to HTML
     html_content = markdown.markdown(markdown_content, extensions=['tables', 'fenced_code'])
     
-    # Add basic CSS styling for better PDF appearance
+    # Styling is applied at render time from the shared _PDF_CSS stylesheet
     styled_html = f"""
     <!DOCTYPE html>
     <html>
     <head>
         <meta charset="UTF-8">
-        <style>
-            @page {{ size: A4; margin: 0.75in; }}
-            body {{ font-family: Arial, sans-serif; line-height: 1.6; }}
-            h1, h2, h3 {{ color: #333; }}
-            h1 {{ border-bottom: 2px solid #333; padding-bottom: 10px; }}
-            h2 {{ border-bottom: 1px solid #ccc; padding-bottom: 5px; }}
-            code {{ background-color: #f4f4f4; padding: 2px 4px; border-radius: 3px; }}
-            pre {{ background-color: #f4f4f4; padding: 10px; border-radius: 5px; overflow-x: auto; }}
-            table {{ border-collapse: collapse; width: 100%; }}
-            th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-            th {{ background-color: #f2f2f2; }}
-        </style>
     </head>
     <body>
         {html_content}
@@ -148,18 +189,100 @@ def save_report_as_pdf(filename: str, markdown_content: str) -> str:
     </html>
     """
     
+    return file_path, styled_html
+
+
+@functools.lru_cache(maxsize=None)
+def _pdf_stylesheet() -> Tuple["CSS", "FontConfiguration"]:
+    """Parse the report stylesheet and load system fonts once per process."""
+    from weasyprint import CSS
+    from weasyprint.text.fonts import FontConfiguration
+    
+    font_config = FontConfiguration()
+    return CSS(string=_PDF_CSS, font_config=font_config), font_config
+
+
+def _render_pdf(styled_html: str, file_path: str) -> None:
+    """Write styled HTML to a PDF with WeasyPrint.
+
+    Module-level so it can be pickled and run in the PDF process pool.
+    """
+    from weasyprint import HTML
+    
+    stylesheet, font_config = _pdf_stylesheet()
+    HTML(string=styled_html).write_pdf(
+        file_path, stylesheets=[stylesheet], font_config=font_config
+    )
+
+
+@functools.cache
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """Create the process pool for PDF rendering on first use.
+
+    Workers are spawned rather than forked: the pool is first used while
+    asyncio's worker threads are running, and forking a threaded process can
+    leave WeasyPrint and Cairo with locks held by threads that no longer exist.
+    """
+    pool = ProcessPoolExecutor(
+        max_workers=min(_PDF_MAX_WORKERS, os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    atexit.register(pool.shutdown)
+    return pool
+
+
+def save_report_as_pdf(filename: str, markdown_content: str) -> str:
+    """
+    Convert markdown content to PDF and save to reports directory.
+    
+    Args:
+        filename: The filename for the PDF (will be sanitized)
+        markdown_content: The markdown content to convert
+    
+    Returns:
+        Success message with file path or error if PDF generation unavailable
+    """
+    file_path, styled_html = _prepare_pdf(filename, markdown_content)
+    
     # Convert HTML to PDF using WeasyPrint
-    HTML(string=styled_html).write_pdf(str(file_path))
+    _render_pdf(styled_html, str(file_path))
     
-    absolute_path = file_path.absolute()
-    logger.info(f"Successfully saved PDF report to: {absolute_path}")
+    logger.info(f"Successfully saved PDF report to: {file_path}")
     
-    return f"Successfully saved PDF report to: {absolute_path}"
+    return f"Successfully saved PDF report to: {file_path}"
+
 
-def save_report_both_formats(topic: str, markdown_content: str) -> str:
+async def save_report_as_pdf_async(filename: str, markdown_content: str) -> str:
+    """
+    Async variant of `save_report_as_pdf` that renders in a worker process.
+    
+    WeasyPrint layout is CPU-bound and holds the GIL, so rendering in the
+    process pool keeps the event loop responsive and lets several reports
+    render in parallel across cores.
+    
+    Args:
+        filename: The filename for the PDF (will be sanitized)
+        markdown_content: The markdown content to convert
+    
+    Returns:
+        Success message with file path
+    """
+    file_path, styled_html = _prepare_pdf(filename, markdown_content)
+    
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(_get_pdf_pool(), _render_pdf, styled_html, str(file_path))
+    
+    logger.info(f"Successfully saved PDF report to: {file_path}")
+    
+    return f"Successfully saved PDF report to: {file_path}"
+
+async def save_report_both_formats(topic: str, markdown_content: str) -> str:
     """
     Save a report in both markdown and PDF formats.
     
+    The two saves are independent, so they run concurrently: the markdown
+    write in a worker thread and the PDF render in the PDF process pool.
+    
     Args:
         topic: The research topic for filename generation
         markdown_content: The markdown content to save
@@ -171,10 +294,9 @@ def save_report_both_formats(topic: str, markdown_content: str) -> str:
     md_filename = create_timestamped_filename(topic, "md")
     pdf_filename = create_timestamped_filename(topic, "pdf")
     
-    # Save markdown
-    md_result = save_report_to_file(md_filename, markdown_content, "markdown")
-    
-    # Save PDF
-    pdf_result = save_report_as_pdf(pdf_filename, markdown_content)
+    md_result, pdf_result = await asyncio.gather(
+        save_report_to_file_async(md_filename, markdown_content, "markdown"),
+        save_report_as_pdf_async(pdf_filename, markdown_content),
+    )
     
     return f"Markdown: {md_result}\nPDF: {pdf_result}"
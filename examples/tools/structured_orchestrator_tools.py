@@ -6,6 +6,7 @@ import json
 
 
 from framework import AgentLoader
+from framework.utils import json_dumps, json_loads
 
 
 async def call_structured_description_agent(topic: str) -> str:
@@ -24,9 +25,9 @@ async def call_structured_description_agent(topic: str) -> str:
 
     # The result should already be structured due to the StructuredOutputAgent
     if isinstance(result, dict):
-        return json.dumps(result)
+        return json_dumps(result)
     else:
-        return json.dumps(
+        return json_dumps(
             {"error": "Failed to get structured output", "raw_result": str(result)}
         )
 
@@ -43,7 +44,7 @@ async def call_structured_story_agent(description_json: str) -> str:
     """
     # Parse the description JSON to create a formatted input
     try:
-        description_data = json.loads(description_json)
+        description_data = json_loads(description_json)
 
         # Format the input for the story agent
         formatted_input = f"""Based on the following details, write a story:
@@ -61,16 +62,16 @@ Please create a compelling story that incorporates all these elements."""
 
         # The result should already be structured due to the StructuredOutputAgent
         if isinstance(result, dict):
-            return json.dumps(result)
+            return json_dumps(result)
         else:
-            return json.dumps(
+            return json_dumps(
                 {"error": "Failed to get structured output", "raw_result": str(result)}
             )
 
     except json.JSONDecodeError:
-        return json.dumps({"error": "Invalid JSON input", "input": description_json})
+        return json_dumps({"error": "Invalid JSON input", "input": description_json})
     except Exception as e:
-        return json.dumps({"error": str(e), "input": description_json})
+        return json_dumps({"error": str(e), "input": description_json})
 
 
 def format_final_output(description_json: str, story_json: str) -> str:
@@ -85,8 +86,11 @@ def format_final_output(description_json: str, story_json: str) -> str:
         JSON string containing the combined, formatted output
     """
     try:
-        description_data = json.loads(description_json)
-        story_data = json.loads(story_json)
+        description_data = json_loads(description_json)
+        story_data = json_loads(story_json)
+
+        # Read once; the summary repeats the count (its name/genre fallbacks differ)
+        word_count = story_data.get("wordCount", 0)
 
         combined_output = {
             "character_info": {
@@ -98,17 +102,21 @@ def format_final_output(description_json: str, story_json: str) -> str:
             "story_info": {
                 "outline": story_data.get("outline", "No outline provided"),
                 "story": story_data.get("story", "No story provided"),
-                "word_count": story_data.get("wordCount", 0),
+                "word_count": word_count,
                 "genre": story_data.get("genre", "Unknown"),
                 "mood": story_data.get("mood", "Neutral"),
             },
-            "summary": f"Created a {story_data.get('genre', 'story')} story about {description_data.get('mainCharacterName', 'a character')} with approximately {story_data.get('wordCount', 0)} words.",
+            "summary": (
+                f"Created a {story_data.get('genre', 'story')} story about "
+                f"{description_data.get('mainCharacterName', 'a character')} "
+                f"with approximately {word_count} words."
+            ),
         }
 
-        return json.dumps(combined_output, indent=2)
+        return json_dumps(combined_output, pretty=True)
 
     except json.JSONDecodeError as e:
-        return json.dumps(
+        return json_dumps(
             {
                 "error": f"JSON decode error: {str(e)}",
                 "description_json": description_json,
@@ -116,7 +124,7 @@ def format_final_output(description_json: str, story_json: str) -> str:
             }
         )
     except Exception as e:
-        return json.dumps(
+        return json_dumps(
             {
                 "error": str(e),
                 "description_json": description_json,
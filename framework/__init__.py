@@ -48,6 +48,7 @@ from framework.file_tools import (
 
 from framework.user_tools import (
     user_input_tool,
+    user_input_tool_async,
     get_current_datetime_tool,
 )
 
@@ -133,6 +134,7 @@ __all__ = [
     "get_temp_directory_info",
     # User Tools
     "user_input_tool",
+    "user_input_tool_async",
     "get_current_datetime_tool",
     # Agents
     "AgentSpecification",
@@ -7,30 +7,120 @@ from the command line with proper argument parsing and execution.
 
 import argparse
 import asyncio
-from framework.declarative_agents import run_agent_from_yaml
+from typing import List, Tuple
+
+from framework.context import AgentContext
+from framework.declarative_agents import AgentLoader, run_agent_from_yaml
+from framework.utils import json_loads
 
 
 def create_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Run declarative agents from YAML files"
     )
-    parser.add_argument("yaml_file", help="Path to the YAML file")
+    parser.add_argument("yaml_file", nargs="?", help="Path to the YAML file")
     parser.add_argument("input", nargs="?", default="", help="Input text for the agent")
     parser.add_argument(
         "--eval",
         action="store_true",
         help="Run evaluation suite for the specified agent YAML",
     )
+    parser.add_argument(
+        "--eval-cache",
+        action="store_true",
+        help="Reuse agent outputs cached by previous evaluation runs (stored in .eval_cache/)",
+    )
+    parser.add_argument(
+        "--eval-cache-judge",
+        action="store_true",
+        help="Reuse judge verdicts cached by previous evaluation runs (stored in .eval_cache/)",
+    )
+    parser.add_argument(
+        "--eval-concurrency",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of evaluation test cases to run concurrently (default: 1)",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help='Run every agent listed in a JSONL file of {"yaml_file": ..., "input": ...} lines on one event loop',
+    )
+    parser.add_argument(
+        "--batch-concurrency",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of batch runs to execute concurrently (default: 1)",
+    )
     return parser
 
 
+def read_batch_file(path: str) -> List[Tuple[str, str]]:
+    """Read (yaml_file, input) pairs from a JSONL batch file, skipping blank lines."""
+    pairs = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            entry = json_loads(line)
+            if not isinstance(entry, dict) or "yaml_file" not in entry:
+                raise ValueError(f"{path}:{line_number}: expected an object with a 'yaml_file' key")
+            pairs.append((entry["yaml_file"], entry.get("input", "")))
+    return pairs
+
+
+async def run_batch(pairs: List[Tuple[str, str]], concurrency: int = 1) -> List[str]:
+    """Run several (yaml_file, input) pairs on the current event loop.
+
+    Each distinct YAML file is loaded once, off the loop, before any run starts.
+    Up to `concurrency` agents then run at once, each with its own context.
+    Agents stream tokens to stdout as they run, so output from concurrent runs
+    interleaves. Results are returned in input order.
+    """
+    yaml_files = list(dict.fromkeys(yaml_file for yaml_file, _ in pairs))
+    specs = dict(
+        zip(
+            yaml_files,
+            await asyncio.gather(
+                *(asyncio.to_thread(AgentLoader.load_from_file, yaml_file) for yaml_file in yaml_files)
+            ),
+        )
+    )
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run_one(yaml_file: str, input_data: str) -> str:
+        async with semaphore:
+            result = await specs[yaml_file].run(input_data, context=AgentContext())
+            return str(result)
+
+    return list(await asyncio.gather(*(run_one(yaml_file, input_data) for yaml_file, input_data in pairs)))
+
+
 async def run_command(args: argparse.Namespace) -> str:
     print("\n=== STARTING DECLARATIVE AGENT ===")
 
+    if args.batch:
+        pairs = read_batch_file(args.batch)
+        results = await run_batch(pairs, concurrency=args.batch_concurrency)
+
+        for (yaml_file, _), result in zip(pairs, results):
+            print(f"\n\n=== FINAL RESULT: {yaml_file} ===")
+            print(result)
+
+        return f"Batch complete: {len(results)} runs"
+
     if args.eval:
         from framework.evaluation import run_evaluation_from_yaml
 
-        await run_evaluation_from_yaml(args.yaml_file)
+        await run_evaluation_from_yaml(
+            args.yaml_file,
+            use_cache=args.eval_cache,
+            concurrency=args.eval_concurrency,
+            use_judge_cache=args.eval_cache_judge,
+        )
         return "Evaluation complete"
 
     result = await run_agent_from_yaml(args.yaml_file, args.input)
@@ -44,6 +134,8 @@ async def run_command(args: argparse.Namespace) -> str:
 def main():
     parser = create_parser()
     args = parser.parse_args()
+    if not args.batch and not args.yaml_file:
+        parser.error("yaml_file is required unless --batch is given")
 
     asyncio.run(run_command(args))
 
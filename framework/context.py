@@ -5,24 +5,100 @@ This module handles the context that flows between agents in workflows,
 allowing agents to access outputs from previous agents in the chain.
 """
 
-import json
-from typing import Dict, Union, Optional
-from pydantic import BaseModel, Field
+from typing import Any, Callable, Dict, Tuple, Union, Optional
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
 from framework.types import InputSchema
+from framework.utils import json_dumps
 
 # Type alias for agent output
 AgentOutput = Union[Dict[str, Union[str, int, float, bool]], str]
 
 
+class _VersionedOutputs(Dict[str, AgentOutput]):
+    """Agent outputs dict that counts its own mutations.
+
+    Lets AgentContext notice stale formatted input even when callers write to
+    `agent_outputs` directly instead of through `add_output`.
+    """
+
+    version = 0
+
+    def __setitem__(self, key: str, value: AgentOutput) -> None:
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.version += 1
+
+    def __ior__(self, other: Any) -> "_VersionedOutputs":
+        super().__ior__(other)
+        self.version += 1
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
+    def pop(self, *args: Any) -> Any:
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self) -> Tuple[str, AgentOutput]:
+        self.version += 1
+        return super().popitem()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        self.version += 1
+        return super().setdefault(key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self.version += 1
+
+
 class AgentContext(BaseModel):
     """Context object that stores outputs from previous agents."""
 
-    agent_outputs: Dict[str, AgentOutput] = Field(default_factory=dict)
+    agent_outputs: Dict[str, AgentOutput] = Field(default_factory=_VersionedOutputs)
+
+    # Formatted context input keyed by (required_context, agent_name), valid for
+    # the outputs dict and version recorded in _formatted_version
+    _formatted_cache: Dict[Tuple[Tuple[str, ...], str], str] = PrivateAttr(default_factory=dict)
+    _formatted_version: Tuple[int, int] = PrivateAttr(default=(0, -1))
+
+    @field_validator("agent_outputs")
+    @classmethod
+    def _track_output_changes(cls, value: Dict[str, AgentOutput]) -> Dict[str, AgentOutput]:
+        return _VersionedOutputs(value)
 
     def add_output(self, agent_name: str, output: AgentOutput) -> None:
         self.agent_outputs[agent_name] = output
 
+    def formatted_input(
+        self, key: Tuple[Tuple[str, ...], str], build: Callable[[], str]
+    ) -> str:
+        """Return the formatted input cached under `key`, building it if needed.
+
+        Entries are dropped whenever the outputs change, so several agents
+        consuming the same outputs share one formatting pass.
+        """
+        outputs = self.agent_outputs
+        if not isinstance(outputs, _VersionedOutputs):
+            # Replaced by a plain dict whose changes cannot be tracked
+            return build()
+
+        version = (id(outputs), outputs.version)
+        if version != self._formatted_version:
+            self._formatted_cache.clear()
+            self._formatted_version = version
+
+        formatted = self._formatted_cache.get(key)
+        if formatted is None:
+            formatted = self._formatted_cache[key] = build()
+        return formatted
+
     def get_output(self, agent_name: str) -> Optional[AgentOutput]:
         return self.agent_outputs.get(agent_name)
 
@@ -50,6 +126,15 @@ class ContextFormatter:
         if not context.agent_outputs:
             return ""
 
+        return context.formatted_input(
+            (tuple(input_schema.required_context), agent_name),
+            lambda: ContextFormatter._build_context_input(context, input_schema, agent_name),
+        )
+
+    @staticmethod
+    def _build_context_input(
+        context: AgentContext, input_schema: InputSchema, agent_name: str
+    ) -> str:
         context_parts = [f"Available context for {agent_name}:"]
 
         if input_schema.required_context:
@@ -58,14 +143,14 @@ class ContextFormatter:
                     output = context.get_output(required_agent)
                     context_parts.append(f"\nFrom {required_agent}:")
                     if isinstance(output, dict):
-                        context_parts.append(json.dumps(output, indent=2))
+                        context_parts.append(json_dumps(output, pretty=True))
                     else:
                         context_parts.append(str(output))
         else:
             for agent_name, output in context.agent_outputs.items():
                 context_parts.append(f"\nFrom {agent_name}:")
                 if isinstance(output, dict):
-                    context_parts.append(json.dumps(output, indent=2))
+                    context_parts.append(json_dumps(output, pretty=True))
                 else:
                     context_parts.append(str(output))
 
@@ -5,10 +5,11 @@ This module handles the creation and execution of agents from YAML specification
 including proper streaming and structured output support.
 """
 
+import functools
+import os
 from dataclasses import dataclass
 from typing import Dict, Type, Union, Optional, List, TypedDict, Sequence
 from inspect import signature
-import yaml
 from pydantic import BaseModel
 from framework.tool_context import set_current_context
 from framework.tools import ToolLoader
@@ -29,7 +30,7 @@ from framework.types import (
 from framework.models import ModelFactory
 from framework.context import AgentContext, ContextFormatter, AgentOutput
 from framework.specialized_agents import StructuredOutputAgent
-from framework.utils import clean_agent_output, remove_think_tags, ThinkTagFilter
+from framework.utils import clean_agent_output, remove_think_tags, ThinkTagFilter, yaml_load
 import json
 import re
 from config import get_external_client, SMALL_MODEL
@@ -343,22 +344,20 @@ class AgentLoader:
 
     @staticmethod
     def load_from_file(yaml_path: str) -> AgentSpecification:
-        """Load an agent specification from a YAML file."""
-        with open(yaml_path, "r") as f:
-            data = yaml.safe_load(f)
+        """Load an agent specification from a YAML file.
 
-        # Enforce top-level YAML structure to fail-fast on unknown keys
-        if not isinstance(data, dict):
-            raise ValueError("YAML root must be a mapping (object)")
-
-        allowed_top_keys = {"agent", "model", "tools", "output_schema", "input_schema", "max_iterations"}
-        unknown_top = set(data.keys()) - allowed_top_keys
-        if unknown_top:
-            raise ValueError(
-                f"Unknown top-level keys in YAML: {sorted(unknown_top)}. Allowed keys: {sorted(allowed_top_keys)}"
-            )
+        Specs are cached per file and reused until the file's modification time
+        or size changes, so agents run repeatedly in one process are parsed and
+        built once. Specs hold no per-run state; agents are created per run.
+        """
+        path = os.path.abspath(yaml_path)
+        stat = os.stat(path)
+        return _load_file_cached(path, stat.st_mtime_ns, stat.st_size)
 
-        return AgentLoader.load_from_dict(data)
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop every cached agent specification."""
+        _load_file_cached.cache_clear()
 
     @staticmethod
     def load_from_dict(
@@ -432,6 +431,31 @@ class AgentLoader:
         return AgentSpecification(definition)
 
 
+def _load_file_uncached(yaml_path: str) -> AgentSpecification:
+    """Parse a YAML file and build its agent specification."""
+    with open(yaml_path, "r") as f:
+        data = yaml_load(f)
+
+    # Enforce top-level YAML structure to fail-fast on unknown keys
+    if not isinstance(data, dict):
+        raise ValueError("YAML root must be a mapping (object)")
+
+    allowed_top_keys = {"agent", "model", "tools", "output_schema", "input_schema", "max_iterations"}
+    unknown_top = set(data.keys()) - allowed_top_keys
+    if unknown_top:
+        raise ValueError(
+            f"Unknown top-level keys in YAML: {sorted(unknown_top)}. Allowed keys: {sorted(allowed_top_keys)}"
+        )
+
+    return AgentLoader.load_from_dict(data)
+
+
+@functools.lru_cache(maxsize=128)
+def _load_file_cached(path: str, _mtime_ns: int, _size: int) -> AgentSpecification:
+    """Build a spec for `path`; the stat fields only key the cache."""
+    return _load_file_uncached(path)
+
+
 async def run_agent_from_yaml(
     yaml_path: str, input_data: str = "", agent_type: AgentType = AgentType.ORCHESTRATOR
 ) -> str:
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import hashlib
 import importlib.util
 import logging
+import os
 from pathlib import Path
 import sys
+import tempfile
 from types import ModuleType
 import json
 import re
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Mapping, Optional, Tuple, Any
 
 from pydantic import BaseModel, Field
 from rich.console import Console
@@ -93,11 +97,25 @@ Convention:
 1. Each agent YAML lives somewhere in the repo (e.g. `.../clarifier_agent.yaml`).
 2. A sibling directory named `evals/` sits next to that YAML. Python files inside
    it define one or more test suites.
-3. A test-suite file must expose exactly one list whose variable name ends with
-   `_test_suite` and exactly one list/tuple of strings whose variable name ends with `_criteria`.
+3. A test-suite file must expose exactly one list/tuple of test cases whose
+   variable name ends with `_test_suite` and exactly one list/tuple of strings
+   whose variable name ends with `_criteria`. Test cases are mappings or
+   NamedTuple records with at least `id` and `prompt` fields.
 
 The framework discovers these variables reflectively and evaluates the agent
 against each case using an AI-judge pattern.
+
+Pass `--eval-concurrency N` to evaluate up to N test cases at once (live token
+streaming is then only written to the log).
+
+Pass `--eval-cache` to reuse agent outputs from previous runs: outputs are
+stored per agent under `.eval_cache/` and keyed by the exact prompt together
+with the agent definition, so editing the YAML invalidates them.
+
+Pass `--eval-cache-judge` to also reuse judge verdicts whose judge input
+(criterion, prompt, agent output and test case) and judge model are unchanged.
+The judge samples at a non-zero temperature, so this pins whichever verdict
+was recorded first; it is meant for reruns rather than for measuring quality.
 """
 
 console = Console()
@@ -136,7 +154,94 @@ if _client is None:
 _judge_agent: Optional[Agent] = None
 _judge_formatter_agent: Optional[Agent] = None
 
+_EVAL_CACHE_DIR = Path(".eval_cache")
+
+
+class _JsonFileCache:
+    """Exact-match cache persisted as a single JSON file.
+
+    Keys are the SHA-256 of a fingerprint plus the lookup text, so changing
+    whatever the fingerprint describes misses every earlier entry. Callers
+    compute a key once with `key()` and use it for both `get()` and `put()`.
+    New entries are held in memory until `flush()` writes the file.
+    """
+
+    def __init__(self, path: Path, fingerprint: str) -> None:
+        self._path = path
+        # The fingerprint is constant per cache, so hash it once and extend copies.
+        self._prefix_hash = hashlib.sha256(f"{fingerprint}\0".encode("utf-8"))
+        self._entries: Dict[str, Any] = {}
+        self._dirty = False
+        if self._path.is_file():
+            try:
+                self._entries = json.loads(self._path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                logger.warning("Ignoring unreadable evaluation cache at %s", self._path)
+
+    def key(self, text: str) -> str:
+        digest = self._prefix_hash.copy()
+        digest.update(text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        return self._entries.get(key)
+
+    def put(self, key: str, output: Any) -> None:
+        self._entries[key] = output
+        self._dirty = True
+
+    def flush(self) -> None:
+        """Write the cache file if entries were added since the last flush.
+
+        The file is written to a temporary sibling and then swapped in, so an
+        interrupted write never leaves a truncated cache behind.
+        """
+        if not self._dirty:
+            return
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self._path.parent, prefix=f".{self._path.name}.", suffix=".tmp")
+        try:
+            try:
+                f = os.fdopen(fd, "w", encoding="utf-8")
+            except BaseException:
+                os.close(fd)
+                raise
+            with f:
+                json.dump(self._entries, f, ensure_ascii=False, default=str)
+            os.replace(tmp_path, self._path)
+        except BaseException:
+            # Clean up the temporary file without masking the original error
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+        self._dirty = False
+
+
+class _AgentOutputCache(_JsonFileCache):
+    """Parsed agent outputs per agent, keyed by the agent definition plus the prompt.
+
+    Any change to the YAML (instructions, model, schema, ...) misses the cache.
+    """
+
+    def __init__(self, agent_spec: AgentSpecification) -> None:
+        super().__init__(
+            _EVAL_CACHE_DIR / f"{agent_spec.definition.name}.json",
+            agent_spec.definition.model_dump_json(),
+        )
+
+
+class _JudgeVerdictCache(_JsonFileCache):
+    """Judge verdicts per agent, keyed by the judge model plus the full judge input.
+
+    The judge input embeds the criterion, prompt, agent output and test case,
+    so a verdict is only reused when all of them are unchanged.
+    """
 
+    def __init__(self, agent_spec: AgentSpecification) -> None:
+        super().__init__(
+            _EVAL_CACHE_DIR / f"{agent_spec.definition.name}.judge.json",
+            f"{_QWEN_MODEL_NAME}\0{_QWEN_MODEL_SETTINGS!r}",
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -144,10 +249,278 @@ _judge_formatter_agent: Optional[Agent] = None
 # ---------------------------------------------------------------------------
 
 
+def _discard_output(*args: Any, **kwargs: Any) -> None:
+    """Stand-in for print() when live streaming is disabled."""
+
+
+def _judge_case_context(test_case: Dict[str, Any], agent_input: str, parsed_output: Any) -> str:
+    """Render the part of the judge prompt shared by every criterion of a test case.
+
+    The criterion is appended last, so all judge calls for a case start with the
+    same text and providers with prefix caching can reuse it.
+    """
+    return f"""The current date is June 2025.
+
+Please evaluate the following agent output for logical correctness.
+The output has already been validated as parsable. You only need to check the content against the single evaluation criterion given at the end.
+
+**Original Prompt:**\n```\n{agent_input}\n```\n\n**Agent's Parsed Output (as JSON):**\n```json\n{parsed_output}\n```\n\n**Test Case Details (for context):**\n```json\n{_format_test_case(test_case)}\n```"""
+
+
+async def _judge_criterion(
+    test_id: str,
+    case_context: str,
+    crit_index: int,
+    single_criterion: str,
+    echo: Callable[..., None],
+    verdict_cache: Optional[_JudgeVerdictCache] = None,
+) -> EvaluationResult:
+    """Ask a fresh judge whether the agent output satisfies a single criterion."""
+
+    judge_agent, judge_formatter_agent = _build_fresh_judge_agents()
+    judge_prompt = f"{case_context}\n\nEvaluation Criterion:\n```\n{single_criterion}\n```"
+
+    verdict_key: Optional[str] = None
+    if verdict_cache is not None:
+        verdict_key = verdict_cache.key(f"{judge_agent.instructions}\0{judge_prompt}")
+        cached_verdict = verdict_cache.get(verdict_key)
+        if cached_verdict is not None:
+            logger.info("Using cached judge verdict for %s criterion %s", test_id, crit_index)
+            return EvaluationResult.model_validate(cached_verdict)
+
+    # Stream judge output to stdout and log file
+    judge_streamed = Runner.run_streamed(
+        starting_agent=judge_agent,
+        input=judge_prompt,
+    )
+
+    judge_raw_chunks: list[str] = []
+    async for event in judge_streamed.stream_events():
+        text_delta = _extract_text_delta_from_event(event)
+        if text_delta is None:
+            continue
+        echo(text_delta, end="", flush=True)
+        judge_raw_chunks.append(text_delta)
+    echo()
+    if judge_raw_chunks:
+        logger.info(
+            "Judge raw stream output for criterion %s (token-by-token):\n%s",
+            crit_index,
+            "".join(judge_raw_chunks),
+        )
+
+    judge_output_text = str(judge_streamed.final_output)
+
+    # Stream formatter output as well
+    formatter_streamed = Runner.run_streamed(
+        starting_agent=judge_formatter_agent,
+        input=judge_output_text,
+    )
+
+    formatter_raw_chunks: list[str] = []
+    async for event in formatter_streamed.stream_events():
+        text_delta = _extract_text_delta_from_event(event)
+        if text_delta is None:
+            continue
+        echo(text_delta, end="", flush=True)
+        formatter_raw_chunks.append(text_delta)
+    echo()
+    if formatter_raw_chunks:
+        logger.info(
+            "Judge formatter raw stream output for criterion %s (token-by-token):\n%s",
+            crit_index,
+            "".join(formatter_raw_chunks),
+        )
+
+    eval_result = formatter_streamed.final_output_as(EvaluationResult)
+
+    if eval_result is None:
+        logger.warning(
+            "[FAIL] %s – judge formatter could not parse result for criterion %s; raw: %s",
+            test_id,
+            crit_index,
+            formatter_streamed.final_output,
+        )
+        return EvaluationResult(passed=False, reasoning="Formatter could not parse result")
+
+    if verdict_cache is not None and verdict_key is not None:
+        verdict_cache.put(verdict_key, eval_result.model_dump())
+
+    level = logging.INFO if eval_result.passed else logging.WARNING
+    logger.log(level, "Criterion %s passed: %s", crit_index, eval_result.passed)
+    logger.info("Criterion %s reasoning: %s", crit_index, eval_result.reasoning)
+    return eval_result
+
+
+async def _evaluate_case(
+    agent_spec: AgentSpecification,
+    direct_agent: Optional[Agent],
+    test_case: Dict[str, Any],
+    index: int,
+    criteria_list: List[str],
+    output_cache: Optional[_AgentOutputCache],
+    verdict_cache: Optional[_JudgeVerdictCache],
+    judge_semaphore: asyncio.Semaphore,
+    stream_to_stdout: bool,
+) -> Dict[str, str]:
+    """Run the agent on one test case, judge it per criterion and return its summary row.
+
+    `direct_agent` is None for structured-output agents, which run through the
+    spec's `StructuredOutputAgent` chain instead.
+    """
+
+    use_structured_output = direct_agent is None
+    echo = print if stream_to_stdout else _discard_output
+
+    test_id: str = test_case.get("id", f"case_{index}")
+    agent_input: str = test_case.get("prompt", "")
+
+    parsed_output = None
+    cached_output = None
+    output_key: Optional[str] = None
+    if output_cache is not None:
+        output_key = output_cache.key(agent_input)
+        cached_output = output_cache.get(output_key)
+
+    if cached_output is not None:
+        parsed_output = cached_output
+        logger.info("Using cached agent output for %s", test_id)
+    elif use_structured_output:
+        # ----------------------------------------------------------
+        # Use the full StructuredOutputAgent chain so that the
+        # formatter model produces clean, parseable JSON.
+        # ----------------------------------------------------------
+        try:
+            result_model = await agent_spec.structured_output_agent.run(
+                agent_input,
+            )
+            # Convert the Pydantic model into a regular dict so that
+            # downstream code (judge prompt) can embed it easily.
+            parsed_output = result_model.model_dump()
+        except Exception as e:
+            logger.exception("Error running StructuredOutputAgent: %s", e)
+            parsed_output = None
+    else:
+        # ----------------------------------------------------------
+        # Legacy path – run the single agent directly with streaming.
+        # This mirrors the live streaming used by non-eval runs so
+        # think tokens are surfaced to stdout and captured in logs.
+        # ----------------------------------------------------------
+        assert direct_agent is not None  # Mypy guard
+
+        # Build kwargs for Runner.run_streamed to honour max_iterations if specified
+        max_turns = 10
+        if agent_spec.definition.max_iterations is not None:
+            max_turns = agent_spec.definition.max_iterations
+
+        streamed = Runner.run_streamed(
+            starting_agent=direct_agent,
+            input=agent_input,
+            max_turns=max_turns,
+        )
+
+        think_filter = ThinkTagFilter()
+        should_print_think = bool(agent_spec.definition.print_think_tokens)
+
+        raw_chunks: list[str] = []
+        visible_chunks: list[str] = []
+
+        async for event in streamed.stream_events():
+            text_delta = _extract_text_delta_from_event(event)
+            if text_delta is None:
+                continue
+
+            raw_chunks.append(text_delta)
+            if should_print_think:
+                echo(text_delta, end="", flush=True)
+                visible_chunks.append(text_delta)
+            else:
+                chunk = think_filter.filter_token(text_delta)
+                if chunk:
+                    echo(chunk, end="", flush=True)
+                    visible_chunks.append(chunk)
+
+        # Ensure newline after stream
+        echo()
+
+        # Persist both raw and visible streams into the evaluation log
+        raw_stream = "".join(raw_chunks)
+        visible_stream = "".join(visible_chunks)
+        if raw_stream:
+            logger.info("Raw stream output (including <think>):\n%s", raw_stream)
+        if visible_stream and visible_stream != raw_stream:
+            logger.info("Visible stream output (after think filtering):\n%s", visible_stream)
+
+        # Use the schema-derived model decided at spec load time
+        agent_stream = streamed
+        if agent_spec.output_model is not None:
+            parsed_output = agent_stream.final_output_as(agent_spec.output_model)
+            # Normalise to a dict like the structured path so cached and
+            # fresh outputs render identically in the judge prompt.
+            if isinstance(parsed_output, BaseModel):
+                parsed_output = parsed_output.model_dump()
+
+    if (
+        output_cache is not None
+        and output_key is not None
+        and cached_output is None
+        and parsed_output is not None
+    ):
+        output_cache.put(output_key, parsed_output)
+
+    if parsed_output is None:
+        logger.debug("No parseable output produced by the agent; skipping judge phase.")
+        return {"id": test_id, "result": "FAIL", "criteria": "0/0"}
+
+    # Judge per criterion independently
+    if not criteria_list:
+        logger.warning("[FAIL] %s – empty criteria list provided; cannot judge.", test_id)
+        return {"id": test_id, "result": "FAIL", "criteria": "0/0"}
+
+    # Rendered once per case; each criterion only appends itself to this text.
+    case_context = _judge_case_context(test_case, agent_input, parsed_output)
+
+    # Criteria are judged independently, so they share the evaluation-wide
+    # judge semaphore and run concurrently when it allows.
+    async def _run_judge(crit_index: int, single_criterion: str) -> EvaluationResult:
+        async with judge_semaphore:
+            return await _judge_criterion(
+                test_id,
+                case_context,
+                crit_index,
+                single_criterion,
+                echo,
+                verdict_cache,
+            )
+
+    per_criterion_results: List[EvaluationResult] = await asyncio.gather(
+        *(
+            _run_judge(crit_index, single_criterion)
+            for crit_index, single_criterion in enumerate(criteria_list, start=1)
+        )
+    )
+
+    # Aggregate: overall pass only if all criteria passed
+    overall_pass = all(r.passed for r in per_criterion_results) if per_criterion_results else False
+    passed_count = sum(1 for r in per_criterion_results if r.passed)
+    total_criteria = len(per_criterion_results)
+    failed_indices = [str(i + 1) for i, r in enumerate(per_criterion_results) if not r.passed]
+    criteria_summary = f"{passed_count}/{total_criteria}" + (f" (failed: {', '.join(failed_indices)})" if failed_indices else "")
+
+    if overall_pass:
+        logger.info("[PASS] Test ID: %s (all %s criteria passed)", test_id, len(per_criterion_results))
+        return {"id": test_id, "result": "PASS", "criteria": criteria_summary}
+    logger.warning("[FAIL] Test ID: %s (failed criteria: %s)", test_id, ", ".join(failed_indices) or "n/a")
+    return {"id": test_id, "result": "FAIL", "criteria": criteria_summary}
+
+
 async def evaluate_agent_against_suite(
     agent_spec: AgentSpecification,
     test_suite: List[Dict[str, Any]],
     evaluation_criteria: List[str],
+    use_cache: bool = False,
+    concurrency: int = 1,
+    use_judge_cache: bool = False,
 ) -> None:
     """Run a test suite against an agent specification and print a summary.
 
@@ -156,6 +529,12 @@ async def evaluate_agent_against_suite(
     Otherwise we fall back to the original direct-agent execution path.
 
     The judge now evaluates the agent output independently against each criterion.
+    With `use_cache`, agent outputs from earlier runs with an identical prompt and
+    agent definition are reused instead of invoking the agent again. With
+    `use_judge_cache`, judge verdicts are likewise reused when the judge would
+    receive exactly the same input. Up to
+    `concurrency` test cases, and separately up to `concurrency` per-criterion
+    judge calls, are evaluated at the same time.
     """
 
     # Cached judge agents are not used for per-criterion evaluation to avoid any hidden state carryover.
@@ -181,188 +560,55 @@ async def evaluate_agent_against_suite(
     _configure_evaluation_logging(logs_dir)
 
     logger.info("--- Starting Evaluation for: %s ---", target_agent_name)
-    pass_count = 0
     total_count = len(test_suite)
 
-    # Data structures to track UI state and logs
-    case_rows: List[Dict[str, str]] = []
-
-    for idx, test_case in enumerate(test_suite, start=1):
-        test_id: str = test_case.get("id", f"case_{idx}")
-        agent_input: str = test_case.get("prompt", "")
-
-        parsed_output = None
-
-        if use_structured_output:
-            # ----------------------------------------------------------
-            # Use the full StructuredOutputAgent chain so that the
-            # formatter model produces clean, parseable JSON.
-            # ----------------------------------------------------------
-            try:
-                result_model = await agent_spec.structured_output_agent.run(
-                    agent_input,
-                )
-                # Convert the Pydantic model into a regular dict so that
-                # downstream code (judge prompt) can embed it easily.
-                parsed_output = result_model.model_dump()
-            except Exception as e:
-                logger.exception("Error running StructuredOutputAgent: %s", e)
-                parsed_output = None
-        else:
-            # ----------------------------------------------------------
-            # Legacy path – run the single agent directly with streaming.
-            # This mirrors the live streaming used by non-eval runs so
-            # think tokens are surfaced to stdout and captured in logs.
-            # ----------------------------------------------------------
-            assert direct_agent is not None  # Mypy guard
-
-            # Build kwargs for Runner.run_streamed to honour max_iterations if specified
-            max_turns = 10
-            if agent_spec.definition.max_iterations is not None:
-                max_turns = agent_spec.definition.max_iterations
-
-            streamed = Runner.run_streamed(
-                starting_agent=direct_agent,
-                input=agent_input,
-                max_turns=max_turns,
+    output_cache = _AgentOutputCache(agent_spec) if use_cache else None
+    verdict_cache = _JudgeVerdictCache(agent_spec) if use_judge_cache else None
+    criteria_list = [str(c).strip() for c in (evaluation_criteria or []) if str(c).strip()]
+
+    # Cases are independent, so up to `concurrency` of them run at once, and
+    # likewise up to `concurrency` judge calls across all cases. Live
+    # token streaming is only echoed when cases run one at a time; otherwise the
+    # interleaved output would be unreadable (streams are still logged).
+    concurrency = max(1, concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    judge_semaphore = asyncio.Semaphore(concurrency)
+
+    async def _run_case(index: int, test_case: Dict[str, Any]) -> Dict[str, str]:
+        async with semaphore:
+            return await _evaluate_case(
+                agent_spec,
+                direct_agent,
+                test_case,
+                index,
+                criteria_list,
+                output_cache,
+                verdict_cache,
+                judge_semaphore,
+                stream_to_stdout=concurrency == 1,
             )
 
-            think_filter = ThinkTagFilter()
-            should_print_think = bool(agent_spec.definition.print_think_tokens)
-
-            raw_chunks: list[str] = []
-            visible_chunks: list[str] = []
-
-            async for event in streamed.stream_events():
-                text_delta = _extract_text_delta_from_event(event)
-                if text_delta is None:
-                    continue
-
-                raw_chunks.append(text_delta)
-                if should_print_think:
-                    print(text_delta, end="", flush=True)
-                    visible_chunks.append(text_delta)
-                else:
-                    chunk = think_filter.filter_token(text_delta)
-                    if chunk:
-                        print(chunk, end="", flush=True)
-                        visible_chunks.append(chunk)
-
-            # Ensure newline after stream
-            print()
-
-            # Persist both raw and visible streams into the evaluation log
-            raw_stream = "".join(raw_chunks)
-            visible_stream = "".join(visible_chunks)
-            if raw_stream:
-                logger.info("Raw stream output (including <think>):\n%s", raw_stream)
-            if visible_stream and visible_stream != raw_stream:
-                logger.info("Visible stream output (after think filtering):\n%s", visible_stream)
-
-            # Use the schema-derived model decided at spec load time
-            agent_stream = streamed
-            if agent_spec.output_model is not None:
-                parsed_output = agent_stream.final_output_as(agent_spec.output_model)
-
-        if parsed_output is None:
-            case_rows.append({"id": test_id, "result": "FAIL", "criteria": "0/0"})
-            logger.debug("No parseable output produced by the agent; skipping judge phase.")
-            continue
-
-        # Judge per criterion independently
-        criteria_list = [str(c).strip() for c in (evaluation_criteria or []) if str(c).strip()]
-        if not criteria_list:
-            case_rows.append({"id": test_id, "result": "FAIL", "criteria": "0/0"})
-            logger.warning("[FAIL] %s – empty criteria list provided; cannot judge.", test_id)
-            continue
-
-        per_criterion_results: List[EvaluationResult] = []
-
-        for crit_index, single_criterion in enumerate(criteria_list, start=1):
-            judge_agent, judge_formatter_agent = _build_fresh_judge_agents()
-            judge_prompt = f"""The current date is June 2025.
-
-Please evaluate the following agent output for logical correctness.
-The output has already been validated as parsable. You only need to check the content against the single evaluation criterion below.
-
-Evaluation Criterion:\n```\n{single_criterion}\n```
-
-**Original Prompt:**\n```\n{agent_input}\n```\n\n**Agent's Parsed Output (as JSON):**\n```json\n{parsed_output}\n```\n\n**Test Case Details (for context):**\n```json\n{test_case}\n```"""
-
-            # Stream judge output to stdout and log file
-            judge_streamed = Runner.run_streamed(
-                starting_agent=judge_agent,
-                input=judge_prompt,
-            )
+    # Data structures to track UI state and logs
+    tasks = [
+        asyncio.create_task(_run_case(idx, test_case))
+        for idx, test_case in enumerate(test_suite, start=1)
+    ]
+    try:
+        case_rows: List[Dict[str, str]] = await asyncio.gather(*tasks)
+    except BaseException:
+        # gather() returns on the first failure while the other cases keep
+        # running; stop and settle them so none writes to a cache after the flush
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    finally:
+        # Persist whatever was cached, even if a case failed part-way through
+        for cache in (output_cache, verdict_cache):
+            if cache is not None:
+                cache.flush()
+    pass_count = sum(1 for row in case_rows if row["result"] == "PASS")
 
-            judge_raw_chunks: list[str] = []
-            async for event in judge_streamed.stream_events():
-                text_delta = _extract_text_delta_from_event(event)
-                if text_delta is None:
-                    continue
-                print(text_delta, end="", flush=True)
-                judge_raw_chunks.append(text_delta)
-            print()
-            if judge_raw_chunks:
-                logger.info(
-                    "Judge raw stream output for criterion %s (token-by-token):\n%s",
-                    crit_index,
-                    "".join(judge_raw_chunks),
-                )
-
-            judge_output_text = str(judge_streamed.final_output)
-
-            # Stream formatter output as well
-            formatter_streamed = Runner.run_streamed(
-                starting_agent=judge_formatter_agent,
-                input=judge_output_text,
-            )
-
-            formatter_raw_chunks: list[str] = []
-            async for event in formatter_streamed.stream_events():
-                text_delta = _extract_text_delta_from_event(event)
-                if text_delta is None:
-                    continue
-                print(text_delta, end="", flush=True)
-                formatter_raw_chunks.append(text_delta)
-            print()
-            if formatter_raw_chunks:
-                logger.info(
-                    "Judge formatter raw stream output for criterion %s (token-by-token):\n%s",
-                    crit_index,
-                    "".join(formatter_raw_chunks),
-                )
-
-            eval_result = formatter_streamed.final_output_as(EvaluationResult)
-
-            if eval_result is None:
-                logger.warning(
-                    "[FAIL] %s – judge formatter could not parse result for criterion %s; raw: %s",
-                    test_id,
-                    crit_index,
-                    formatter_streamed.final_output,
-                )
-                per_criterion_results.append(EvaluationResult(passed=False, reasoning="Formatter could not parse result"))
-            else:
-                per_criterion_results.append(eval_result)
-                level = logging.INFO if eval_result.passed else logging.WARNING
-                logger.log(level, "Criterion %s passed: %s", crit_index, eval_result.passed)
-                logger.info("Criterion %s reasoning: %s", crit_index, eval_result.reasoning)
-
-        # Aggregate: overall pass only if all criteria passed
-        overall_pass = all(r.passed for r in per_criterion_results) if per_criterion_results else False
-        passed_count = sum(1 for r in per_criterion_results if r.passed)
-        total_criteria = len(per_criterion_results)
-        failed_indices = [str(i + 1) for i, r in enumerate(per_criterion_results) if not r.passed]
-        criteria_summary = f"{passed_count}/{total_criteria}" + (f" (failed: {', '.join(failed_indices)})" if failed_indices else "")
-
-        if overall_pass:
-            pass_count += 1
-            case_rows.append({"id": test_id, "result": "PASS", "criteria": criteria_summary})
-            logger.info("[PASS] Test ID: %s (all %s criteria passed)", test_id, len(per_criterion_results))
-        else:
-            case_rows.append({"id": test_id, "result": "FAIL", "criteria": criteria_summary})
-            logger.warning("[FAIL] Test ID: %s (failed criteria: %s)", test_id, ", ".join(failed_indices) or "n/a")
 
     # Summary
     table = Table(show_header=True, header_style="bold magenta")
@@ -434,21 +680,22 @@ def _load_eval_module(yaml_path: str) -> ModuleType:
 def _extract_suite_and_criteria(module: ModuleType) -> Tuple[List[Dict[str, Any]], List[str]]:
     """Extract the test suite list and criteria list from the module via naming convention.
 
-    The criteria must be a list/tuple of strings.
+    The test suite may be a list/tuple of mappings or NamedTuple records; each case
+    is normalised to a dict. The criteria must be a list/tuple of strings.
     """
 
     test_suite: Optional[List[Dict[str, Any]]] = None
     criteria: Optional[List[str]] = None
 
     for attr_name, attr_val in vars(module).items():
-        if attr_name.endswith("_test_suite") and isinstance(attr_val, list):
-            test_suite = attr_val
+        if attr_name.endswith("_test_suite") and isinstance(attr_val, (list, tuple)):
+            test_suite = [_test_case_as_dict(case) for case in attr_val]
         elif attr_name.endswith("_criteria") and isinstance(attr_val, (list, tuple)):
             criteria = [str(c) for c in attr_val]
 
     if test_suite is None or criteria is None:
         raise AttributeError(
-            "Evaluation module must define variables ending with `_test_suite` (list) "
+            "Evaluation module must define variables ending with `_test_suite` (list | tuple) "
             "and `_criteria` (list | tuple of strings)."
         )
 
@@ -458,6 +705,23 @@ def _extract_suite_and_criteria(module: ModuleType) -> Tuple[List[Dict[str, Any]
 # --- Helper functions -------------------------------------------------------
 
 
+def _test_case_as_dict(test_case: Any) -> Dict[str, Any]:
+    """Normalise a test case (mapping or NamedTuple record) to a plain dict."""
+    if isinstance(test_case, Mapping):
+        return dict(test_case)
+    if isinstance(test_case, tuple) and hasattr(test_case, "_asdict"):
+        return test_case._asdict()
+    raise TypeError(
+        f"Unsupported test case type {type(test_case).__name__}; "
+        "expected a mapping or a NamedTuple."
+    )
+
+
+def _format_test_case(test_case: Dict[str, Any]) -> str:
+    """Render a test case as JSON for embedding in the judge prompt."""
+    return json.dumps(test_case, indent=2, ensure_ascii=False, default=str)
+
+
 def _configure_evaluation_logging(logs_dir: Path) -> None:
     """Ensure evaluation logs go to both stdout and a rotating file.
 
@@ -589,7 +853,12 @@ You may use <think> tags to reason about the query before producing your final o
 # --- Public entrypoint ------------------------------------------------------
 
 
-async def run_evaluation_from_yaml(yaml_path: str) -> None:
+async def run_evaluation_from_yaml(
+    yaml_path: str,
+    use_cache: bool = False,
+    concurrency: int = 1,
+    use_judge_cache: bool = False,
+) -> None:
     """Discover and execute the evaluation associated with a YAML agent spec."""
 
     with trace(f"AI Judge Evaluation Suite — {yaml_path}"):
@@ -601,13 +870,32 @@ async def run_evaluation_from_yaml(yaml_path: str) -> None:
         test_suite, evaluation_criteria = _extract_suite_and_criteria(eval_module)
 
         # 3. Execute evaluation using the spec (handles structured agents)
-        await evaluate_agent_against_suite(agent_spec, test_suite, evaluation_criteria)
+        await evaluate_agent_against_suite(
+            agent_spec,
+            test_suite,
+            evaluation_criteria,
+            use_cache=use_cache,
+            concurrency=concurrency,
+            use_judge_cache=use_judge_cache,
+        )
 
 
 # Handy synchronous wrapper (for potential future CLI integration)
 
 
-def run_evaluation_sync(yaml_path: str) -> None:
+def run_evaluation_sync(
+    yaml_path: str,
+    use_cache: bool = False,
+    concurrency: int = 1,
+    use_judge_cache: bool = False,
+) -> None:
     """Blocking wrapper around `run_evaluation_from_yaml` for convenience."""
 
-    asyncio.run(run_evaluation_from_yaml(yaml_path))
+    asyncio.run(
+        run_evaluation_from_yaml(
+            yaml_path,
+            use_cache=use_cache,
+            concurrency=concurrency,
+            use_judge_cache=use_judge_cache,
+        )
+    )
@@ -5,7 +5,7 @@ This module handles the creation of Pydantic models from JSON schemas
 and provides utilities for working with structured output.
 """
 
-from typing import Dict, Type, Union, List, Tuple
+from typing import Dict, Literal, Type, Union, List, Tuple
 from pydantic import BaseModel, Field, create_model
 
 from framework.types import FieldType, OutputSchema
@@ -73,7 +73,7 @@ class ModelFactory:
         """Convert a (sub)schema field definition to a Python/Pydantic type.
 
         Handles:
-        - string, integer, number, boolean
+        - string (an ``enum`` list of strings becomes a Literal), integer, number, boolean
         - array (including arrays of objects)
         - object (nested models constructed recursively)
         """
@@ -83,7 +83,18 @@ class ModelFactory:
         field_type_str = str(field_type_val)
 
         if field_type_str == FieldType.STRING:
-            return str
+            enum_values = field_def.get("enum")
+            if enum_values is None:
+                return str
+            if (
+                not isinstance(enum_values, list)
+                or not enum_values
+                or not all(isinstance(value, str) for value in enum_values)
+            ):
+                raise ValueError(
+                    f"enum must be a non-empty list of strings for {model_name_prefix}"
+                )
+            return Literal[tuple(enum_values)]  # type: ignore[return-value]
         if field_type_str == FieldType.INTEGER:
             return int
         if field_type_str == FieldType.NUMBER:
@@ -8,16 +8,16 @@ including dynamic function imports, tool validation, and declarative agent-as-to
 import importlib
 import pathlib
 from typing import List, Callable, Protocol, Optional, Awaitable, Callable as _Callable
-import yaml
 
 from agents import function_tool, FunctionTool
 
 from framework.types import ToolSpecification
 from framework.file_tools import read_file, append_to_file, get_temp_directory_info
-from framework.user_tools import user_input_tool, get_current_datetime_tool
+from framework.user_tools import user_input_tool, user_input_tool_async, get_current_datetime_tool
 from framework.input_sources import InputSourceHandler
 from framework.tool_context import get_current_context
 from framework.sandbox_tools import run_python_sandboxed
+from framework.utils import yaml_load
 
 
 class ToolFunction(Protocol):
@@ -59,6 +59,7 @@ class ToolLoader:
         "read_file": read_file,
         "append_to_file": append_to_file,
         "user_input_tool": user_input_tool,
+        "user_input_tool_async": user_input_tool_async,
         "get_current_datetime_tool": get_current_datetime_tool,
         "get_temp_directory_info": get_temp_directory_info,
         "run_python_sandboxed": run_python_sandboxed,
@@ -139,7 +140,7 @@ class ToolLoader:
         # Validate the YAML file can be loaded
         try:
             with open(tool.agent_yaml_path, "r") as f:
-                data = yaml.safe_load(f)
+                data = yaml_load(f)
             if "agent" not in data:
                 raise ValueError(
                     f"Agent YAML file {tool.agent_yaml_path} must contain 'agent' section"
@@ -5,9 +5,10 @@ This module provides tools for agents to interact with users,
 including prompting for input and handling user responses.
 """
 
-import json
+import asyncio
 import logging
-from datetime import datetime, timezone
+
+from framework.utils import iso_now, json_dumps
 
 logger = logging.getLogger(__name__)
 
@@ -15,10 +16,18 @@ logger = logging.getLogger(__name__)
 def user_input_tool(prompt_message: str) -> str:
     user_input = input(prompt_message + " ").strip()
     logger.debug("User input received: %s...", user_input[:50])
-    return json.dumps({"user_input": user_input})
+    return json_dumps({"user_input": user_input})
+
+
+async def user_input_tool_async(prompt_message: str) -> str:
+    # input() blocks, so wait for it on a worker thread and keep the event loop
+    # servicing concurrent agents while the user types
+    user_input = (await asyncio.to_thread(input, prompt_message + " ")).strip()
+    logger.debug("User input received: %s...", user_input[:50])
+    return json_dumps({"user_input": user_input})
 
 
 def get_current_datetime_tool() -> str:
-    now = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    now = iso_now(utc=True)
     logger.debug("Generated current datetime: %s", now)
-    return json.dumps({"current_datetime": now})
+    return json_dumps({"current_datetime": now})
@@ -2,11 +2,27 @@
 Utility functions for the declarative agent framework.
 
 This module provides common utilities used across the framework,
-including think tag removal for cleaner agent outputs.
+including think tag removal for cleaner agent outputs, fast JSON
+serialization for tool responses and YAML parsing for agent specs.
 """
 
+import json
 import re
-from typing import Union
+import time
+from datetime import datetime, timezone
+from typing import IO, Any, Optional, Tuple, Union
+
+import yaml
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speed-up; fall back to the stdlib encoder
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml; use the pure-Python loader
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
 
 def remove_think_tags(text: str) -> str:
@@ -94,3 +110,66 @@ class ThinkTagFilter:
     def reset(self):
         self.inside_think_tag = False
         self.buffer = ""
+
+
+# Last (epoch second, ISO string) pair handed out by iso_now, per time zone
+_last_local_iso: Optional[Tuple[int, str]] = None
+_last_utc_iso: Optional[Tuple[int, str]] = None
+
+
+def iso_now(*, utc: bool = False) -> str:
+    """Return the current time as ISO 8601 at one-second resolution.
+
+    Local time without an offset by default, or UTC with a `+00:00` offset when
+    `utc` is set. The string is formatted at most once per second.
+    """
+    global _last_local_iso, _last_utc_iso
+    second = int(time.time())
+    last = _last_utc_iso if utc else _last_local_iso
+    if last is not None and last[0] == second:
+        return last[1]
+
+    stamp = datetime.fromtimestamp(second, timezone.utc if utc else None).isoformat()
+    if utc:
+        _last_utc_iso = (second, stamp)
+    else:
+        _last_local_iso = (second, stamp)
+    return stamp
+
+
+def json_dumps(value: Any, *, pretty: bool = False) -> str:
+    """Serialize a value to a JSON string, using orjson when it is installed.
+
+    Output is compact unless `pretty` is set, which indents by two spaces.
+    Non-ASCII text is written as-is rather than escaped.
+    """
+    if orjson is not None:
+        try:
+            option = orjson.OPT_INDENT_2 if pretty else 0
+            return orjson.dumps(value, option=option).decode("utf-8")
+        except TypeError:
+            # e.g. integers wider than 64 bits; let the stdlib encoder handle them
+            pass
+    if pretty:
+        return json.dumps(value, ensure_ascii=False, indent=2)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def json_loads(text: Union[str, bytes]) -> Any:
+    """Parse a JSON document, using orjson when it is installed.
+
+    Invalid input raises `json.JSONDecodeError` either way (orjson's error
+    subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def yaml_load(stream: Union[str, IO[str]]) -> Any:
+    """Safely parse a YAML document, using libyaml's C loader when available.
+
+    Accepts a string or an open file, which is parsed as a stream without
+    reading it into memory first.
+    """
+    return yaml.load(stream, Loader=_YamlLoader)